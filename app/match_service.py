@@ -1,11 +1,20 @@
 """Service layer for managing Taekwondo match operations."""
 
-from typing import Optional
-from sqlmodel import Session
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Callable, Iterator, Optional, Sequence
+from sqlalchemy import Update
+from sqlmodel import Session, col, desc, func, insert, select, update
+from sqlmodel.sql.expression import SelectOfScalar
 from datetime import datetime
 
 from app.database import get_session
 from app.models import (
+    EventType,
     Match,
     MatchEvent,
     TeamColor,
@@ -16,46 +25,125 @@ from app.models import (
     MatchStateChange,
     RoundChange,
     MatchReset,
+    utc_now,
 )
 
+logger = logging.getLogger(__name__)
+
+MatchAction = ScoreAction | GamJeomAction | MatchStateChange | RoundChange | MatchReset
+
+# Audit events are written through the Core table, bypassing the ORM
+_MATCH_EVENTS_TABLE = MatchEvent.__table__  # type: ignore[attr-defined]
+
+
+@dataclass(slots=True)
+class _MatchEventRow:
+    """Column values of one match_events row on the write path; MatchEvent stays the read model."""
+
+    match_id: int
+    event_type: EventType
+    team_color: Optional[TeamColor]
+    points_awarded: int
+    round_number: int
+    round_before: int
+    match_state_before: MatchState
+    match_state_after: MatchState
+    blue_score_before: int
+    red_score_before: int
+    blue_gam_jeom_before: int
+    red_gam_jeom_before: int
+    blue_score_after: int
+    red_score_after: int
+    blue_gam_jeom_after: int
+    red_gam_jeom_after: int
+    notes: Optional[str]
+    created_at: datetime
+
+
+@dataclass(slots=True)
+class MatchSnapshot:
+    """Live values of one match; the matches row is a checkpointed copy of them."""
+
+    id: int
+    blue_score: int
+    red_score: int
+    blue_gam_jeom: int
+    red_gam_jeom: int
+    current_round: int
+    match_state: MatchState
+    updated_at: datetime
+    # Actions applied since the matches row was last written
+    pending_events: int = 0
+
+
+# Keep one session per service so the identity map serves the hot match row across consecutive
+# actions. Only safe while this process is the sole writer of the match, hence opt-in.
+REUSE_MATCH_SESSION = os.environ.get("APP_REUSE_MATCH_SESSION", "false").lower() == "true"
+
+# Coalescing window of the queued write path (queue_score / queue_gam_jeom)
+FLUSH_MAX_BATCH = 50
+FLUSH_MAX_DELAY_MS = 20
+
+# Blocking database work started from the event loop runs here. A single worker keeps writes in
+# submission order and never competes with other blocking work for the default executor.
+DB_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="match-db")
+
+# The matches row is written back every CHECKPOINT_EVERY_EVENTS actions and on every state, round or
+# reset change; in between, match_events hold the latest values
+CHECKPOINT_EVERY_EVENTS = 10
+
 
 class MatchService:
     """Service class for managing Taekwondo match operations."""
 
-    def __init__(self):
+    def __init__(self, reuse_session: bool = REUSE_MATCH_SESSION):
         self._current_match_id: Optional[int] = None
+        self._reuse_session = reuse_session
+        self._session: Optional[Session] = None
+        # Event rows buffered by batch_events(), written with one bulk insert
+        self._event_batch: Optional[list[dict[str, Any]]] = None
+        # Last known state of the current match, refreshed by every mutation
+        self._cached_state: Optional[CurrentMatchState] = None
+        self._cached_state_match_id: Optional[int] = None
+        self._flush_queue: Optional[_FlushQueue] = None
+        # Write-back state of the matches this service has touched, keyed by match id
+        self._live_match: dict[int, MatchSnapshot] = {}
+
+    def ensure_current_match(self) -> int:
+        """Return the current match ID, creating a new match if there is none."""
+        if self._current_match_id is not None:
+            return self._current_match_id
+        return self.create_new_match()
 
     def create_new_match(self) -> int:
         """Create a new match and return its ID."""
-        with get_session() as session:
-            match = Match()
+        now = self._now()
+        with self._session_scope() as session:
+            match = Match(created_at=now, updated_at=now)
             session.add(match)
-            session.commit()
-            session.refresh(match)
+            session.flush()
 
-            if match.id is None:
+            match_id = match.id
+            if match_id is None:
                 raise ValueError("Failed to create match")
 
-            self._current_match_id = match.id
+            snapshot = self._snapshot_from_match(match_id, match)
+            state = self._state_from_match(snapshot)
 
             # Record match creation event
-            self._record_event(
-                session=session,
-                match_id=match.id,
-                event_type="MATCH_CREATED",
-                round_number=1,
-                blue_score_before=0,
-                red_score_before=0,
-                blue_gam_jeom_before=0,
-                red_gam_jeom_before=0,
-                blue_score_after=0,
-                red_score_after=0,
-                blue_gam_jeom_after=0,
-                red_gam_jeom_after=0,
-                notes="New match created",
-            )
+            self._record_event(session, self._created_event_row(snapshot, now))
+            session.commit()
+            # Only a committed match becomes the current one
+            self._current_match_id = match_id
+            self._live_match[match_id] = snapshot
+            self._cache_state(match_id, state)
+
+            return match_id
 
-            return match.id
+    @staticmethod
+    def _now() -> datetime:
+        """Timestamp shared by the match update and its event within one transaction."""
+        return utc_now()
 
     def get_current_match_id(self) -> Optional[int]:
         """Get the current match ID."""
@@ -63,283 +151,624 @@ class MatchService:
 
     def set_current_match_id(self, match_id: int) -> None:
         """Set the current match ID."""
+        if match_id != self._current_match_id:
+            self._cached_state = None
+            self._cached_state_match_id = None
+            self._close_session()
+            # Rebuilt from the database on next use, in case another writer moved the match on
+            self._live_match.pop(match_id, None)
         self._current_match_id = match_id
 
+    def clear_current_match(self) -> None:
+        """Forget the current match; the next ensure_current_match() creates a new one."""
+        if self._current_match_id is not None:
+            self._live_match.pop(self._current_match_id, None)
+        self._current_match_id = None
+        self._cached_state = None
+        self._cached_state_match_id = None
+        self._close_session()
+
     def get_current_state(self) -> CurrentMatchState:
         """Get the current match state."""
         if self._current_match_id is None:
             return CurrentMatchState()
 
-        with get_session() as session:
-            match = session.get(Match, self._current_match_id)
-            if match is None:
-                return CurrentMatchState()
-
-            return CurrentMatchState(
-                blue_score=match.blue_score,
-                red_score=match.red_score,
-                blue_gam_jeom=match.blue_gam_jeom,
-                red_gam_jeom=match.red_gam_jeom,
-                current_round=match.current_round,
-                match_state=match.match_state,
-            )
+        if self._cached_state is not None and self._cached_state_match_id == self._current_match_id:
+            return self._cached_state
+
+        snapshot = self._live_snapshot(self._current_match_id)
+        if snapshot is None:
+            return CurrentMatchState()
+
+        state = self._state_from_match(snapshot)
+        self._cache_state(self._current_match_id, state)
+        return state
 
     def add_score(self, action: ScoreAction) -> CurrentMatchState:
         """Add points to a team's score."""
-        if self._current_match_id is None:
-            raise ValueError("No active match")
+        return self._apply(action)
 
-        with get_session() as session:
-            match = session.get(Match, self._current_match_id)
-            if match is None:
+    def add_gam_jeom(self, action: GamJeomAction) -> CurrentMatchState:
+        """Add a Gam-Jeom penalty and award point to opposing team."""
+        return self._apply(action)
+
+    def change_match_state(self, change: MatchStateChange) -> CurrentMatchState:
+        """Change the match state (start, pause, etc.)."""
+        return self._apply(change)
+
+    def next_round(self, change: RoundChange) -> CurrentMatchState:
+        """Advance to the next round."""
+        return self._apply(change)
+
+    def reset_match(self, reset_action: MatchReset) -> CurrentMatchState:
+        """Reset all match scores and counts."""
+        return self._apply(reset_action)
+
+    def apply_actions(self, match_id: int, actions: Sequence[MatchAction]) -> CurrentMatchState:
+        """Apply several actions to a match in order, in a single transaction, and return the final state."""
+        for action in actions:
+            if action.match_id != match_id:
+                raise ValueError(f"Action for match {action.match_id} passed to match {match_id}")
+
+        if not actions:
+            snapshot = self._live_snapshot(match_id)
+            if snapshot is None:
                 raise ValueError("Match not found")
+            return self._state_from_match(snapshot)
 
-            # Store before state
-            blue_before = match.blue_score
-            red_before = match.red_score
-            blue_gj_before = match.blue_gam_jeom
-            red_gj_before = match.red_gam_jeom
+        return self._apply_queued([(match_id, action) for action in actions])[-1]
 
-            # Update score
-            if action.team_color == TeamColor.BLUE:
-                match.blue_score += action.points
-            else:
-                match.red_score += action.points
+    def checkpoint(self) -> None:
+        """Write the live values of every match with pending actions back to the matches table."""
+        pending = [snapshot for snapshot in self._live_match.values() if snapshot.pending_events]
+        if not pending:
+            return
 
-            match.updated_at = datetime.utcnow()
-            session.add(match)
+        with self._session_scope() as session:
+            for snapshot in pending:
+                self._write_checkpoint(session, snapshot)
             session.commit()
 
-            # Record event
-            if match.id is not None:
-                self._record_event(
-                    session=session,
-                    match_id=match.id,
-                    event_type="SCORE",
-                    team_color=action.team_color,
-                    points_awarded=action.points,
-                    round_number=match.current_round,
-                    blue_score_before=blue_before,
-                    red_score_before=red_before,
-                    blue_gam_jeom_before=blue_gj_before,
-                    red_gam_jeom_before=red_gj_before,
-                    blue_score_after=match.blue_score,
-                    red_score_after=match.red_score,
-                    blue_gam_jeom_after=match.blue_gam_jeom,
-                    red_gam_jeom_after=match.red_gam_jeom,
-                    notes=f"{action.team_color.value} team scored {action.points} points",
-                )
-
-            return self.get_current_state()
+    async def shutdown(self) -> None:
+        """Finish the queued writes, then checkpoint on the database executor; for the app's shutdown hook."""
+        if self._flush_queue is not None:
+            await self._flush_queue.drain()
+        await asyncio.get_running_loop().run_in_executor(DB_EXECUTOR, self.checkpoint)
+
+    async def queue_score(self, action: ScoreAction) -> CurrentMatchState:
+        """Add points through the coalescing write queue; resolves once its batch is committed."""
+        return await self._submit(action)
+
+    async def queue_gam_jeom(self, action: GamJeomAction) -> CurrentMatchState:
+        """Add a Gam-Jeom penalty through the coalescing write queue; resolves once its batch is committed."""
+        return await self._submit(action)
+
+    async def queue_state_change(self, change: MatchStateChange) -> CurrentMatchState:
+        """Change the match state through the coalescing write queue, in order with queued scores."""
+        return await self._submit(change)
+
+    async def queue_round_change(self, change: RoundChange) -> CurrentMatchState:
+        """Advance the round through the coalescing write queue, in order with queued scores."""
+        return await self._submit(change)
+
+    async def queue_reset(self, reset_action: MatchReset) -> CurrentMatchState:
+        """Reset the match through the coalescing write queue, in order with queued scores."""
+        return await self._submit(reset_action)
+
+    def add_events_bulk(self, event_rows: list[dict[str, Any]]) -> None:
+        """Insert many match events in a single statement and transaction.
+
+        Intended for replaying or importing match logs. All rows must provide the same columns.
+        The imported rows are the newest events of their matches, so the last one of each match
+        sets its values, here and after a restart. Live values are checkpointed first and then
+        reloaded from the database.
+        """
+        if not event_rows:
+            return
+
+        match_ids = {row["match_id"] for row in event_rows}
+        with self._session_scope() as session:
+            for match_id in match_ids:
+                live = self._live_match.get(match_id)
+                if live is not None and live.pending_events:
+                    self._write_checkpoint(session, live)
+            session.execute(insert(_MATCH_EVENTS_TABLE), event_rows)
+            session.commit()
 
-    def add_gam_jeom(self, action: GamJeomAction) -> CurrentMatchState:
-        """Add a Gam-Jeom penalty and award point to opposing team."""
-        if self._current_match_id is None:
-            raise ValueError("No active match")
+        for match_id in match_ids:
+            self._live_match.pop(match_id, None)
+        if self._cached_state_match_id in match_ids:
+            self._cached_state = None
+            self._cached_state_match_id = None
+
+    @contextmanager
+    def batch_events(self) -> Iterator[None]:
+        """Buffer events recorded inside the block and write them with one bulk insert at the end.
+
+        Match updates are still committed per action; only the audit rows are deferred. The live
+        values already include every buffered action, so the rows are written even when the block
+        raises; otherwise a reload would lose those actions.
+        """
+        if self._event_batch is not None:
+            yield
+            return
+
+        event_rows: list[dict[str, Any]] = []
+        self._event_batch = event_rows
+        try:
+            yield
+        finally:
+            self._event_batch = None
+            self.add_events_bulk(event_rows)
+
+    @contextmanager
+    def _session_scope(self) -> Iterator[Session]:
+        """Provide the session for one operation, either fresh or the reused one."""
+        if not self._reuse_session:
+            with get_session() as session:
+                yield session
+            return
+
+        if self._session is None:
+            self._session = get_session()
+        session = self._session
+        try:
+            yield session
+            # End the transaction so the connection goes back to the pool; the identity map stays
+            session.commit()
+        except Exception:
+            session.rollback()
+            self._close_session()
+            raise
+
+    def _close_session(self) -> None:
+        """Drop the reused session, if any."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _state_from_match(self, match: MatchSnapshot) -> CurrentMatchState:
+        """Build the UI state from the live match values, without another query.
+
+        The values come from the service itself, so Pydantic validation is skipped.
+        """
+        return CurrentMatchState.model_construct(
+            blue_score=match.blue_score,
+            red_score=match.red_score,
+            blue_gam_jeom=match.blue_gam_jeom,
+            red_gam_jeom=match.red_gam_jeom,
+            current_round=match.current_round,
+            match_state=match.match_state,
+        )
 
-        with get_session() as session:
-            match = session.get(Match, self._current_match_id)
+    def _live_snapshot(self, match_id: int) -> Optional[MatchSnapshot]:
+        """Return the live values of a match, loading them on first use."""
+        snapshot = self._live_match.get(match_id)
+        if snapshot is None:
+            snapshot = self._load_snapshot(match_id)
+            if snapshot is not None:
+                self._live_match[match_id] = snapshot
+        return snapshot
+
+    def _load_snapshot(self, match_id: int) -> Optional[MatchSnapshot]:
+        """Rebuild the live values from the last checkpoint and the events recorded after it.
+
+        Every event stores the complete scores, round and state after it, so the latest event
+        recorded after the checkpoint is all that needs replaying.
+        """
+        with self._session_scope() as session:
+            match = session.get(Match, match_id)
             if match is None:
-                raise ValueError("Match not found")
+                return None
+
+            latest = session.exec(self._latest_event_query(match_id)).first()
+            return self._replay_latest_event(self._snapshot_from_match(match_id, match), match.last_event_id, latest)
+
+    @staticmethod
+    def _latest_event_query(match_id: int) -> SelectOfScalar[MatchEvent]:
+        return select(MatchEvent).where(MatchEvent.match_id == match_id).order_by(desc(col(MatchEvent.id))).limit(1)
+
+    @staticmethod
+    def _replay_latest_event(
+        snapshot: MatchSnapshot, last_event_id: int, latest: Optional[MatchEvent]
+    ) -> MatchSnapshot:
+        """Move the checkpointed values forward to the latest event, if it came after the checkpoint.
+
+        Event ids are compared rather than timestamps, which can tie or step back with the clock.
+        """
+        if latest is not None and latest.id is not None and latest.id > last_event_id:
+            snapshot.blue_score = latest.blue_score_after
+            snapshot.red_score = latest.red_score_after
+            snapshot.blue_gam_jeom = latest.blue_gam_jeom_after
+            snapshot.red_gam_jeom = latest.red_gam_jeom_after
+            snapshot.current_round = latest.round_number
+            snapshot.match_state = latest.match_state_after
+            snapshot.updated_at = latest.created_at
+            snapshot.pending_events = 1
+        return snapshot
+
+    @staticmethod
+    def _snapshot_from_match(match_id: int, match: Match) -> MatchSnapshot:
+        return MatchSnapshot(
+            id=match_id,
+            blue_score=match.blue_score,
+            red_score=match.red_score,
+            blue_gam_jeom=match.blue_gam_jeom,
+            red_gam_jeom=match.red_gam_jeom,
+            current_round=match.current_round,
+            match_state=match.match_state,
+            updated_at=match.updated_at,
+        )
 
-            # Store before state
-            blue_before = match.blue_score
-            red_before = match.red_score
-            blue_gj_before = match.blue_gam_jeom
-            red_gj_before = match.red_gam_jeom
-
-            # Apply penalty and award point to opponent
-            if action.penalized_team == TeamColor.BLUE:
-                match.blue_gam_jeom += 1
-                match.red_score += 1  # Opposing team gets a point
-            else:
-                match.red_gam_jeom += 1
-                match.blue_score += 1  # Opposing team gets a point
-
-            match.updated_at = datetime.utcnow()
-            session.add(match)
-            session.commit()
+    def _write_checkpoint(self, session: Session, snapshot: MatchSnapshot) -> None:
+        """Write the live values back to the matches row."""
+        session.execute(self._checkpoint_statement(snapshot))
+        snapshot.pending_events = 0
+
+    @staticmethod
+    def _checkpoint_statement(snapshot: MatchSnapshot) -> Update:
+        return (
+            update(Match)
+            .where(col(Match.id) == snapshot.id)
+            .values(
+                blue_score=snapshot.blue_score,
+                red_score=snapshot.red_score,
+                blue_gam_jeom=snapshot.blue_gam_jeom,
+                red_gam_jeom=snapshot.red_gam_jeom,
+                current_round=snapshot.current_round,
+                match_state=snapshot.match_state,
+                updated_at=snapshot.updated_at,
+                # Events still buffered by batch_events() get higher ids and are replayed on load
+                last_event_id=func.coalesce(
+                    select(func.max(MatchEvent.id)).where(MatchEvent.match_id == snapshot.id).scalar_subquery(), 0
+                ),
+            )
+        )
 
-            # Record event
-            opposing_team = TeamColor.RED if action.penalized_team == TeamColor.BLUE else TeamColor.BLUE
-            if match.id is not None:
-                self._record_event(
-                    session=session,
-                    match_id=match.id,
-                    event_type="GAM_JEOM",
-                    team_color=action.penalized_team,
-                    points_awarded=1,
-                    round_number=match.current_round,
-                    blue_score_before=blue_before,
-                    red_score_before=red_before,
-                    blue_gam_jeom_before=blue_gj_before,
-                    red_gam_jeom_before=red_gj_before,
-                    blue_score_after=match.blue_score,
-                    red_score_after=match.red_score,
-                    blue_gam_jeom_after=match.blue_gam_jeom,
-                    red_gam_jeom_after=match.red_gam_jeom,
-                    notes=f"Gam-Jeom penalty for {action.penalized_team.value}, point awarded to {opposing_team.value}",
-                )
-
-            return self.get_current_state()
+    def _cache_state(self, match_id: int, state: CurrentMatchState) -> None:
+        """Remember the latest committed state so reads can skip the database."""
+        self._cached_state = state
+        self._cached_state_match_id = match_id
 
-    def change_match_state(self, change: MatchStateChange) -> CurrentMatchState:
-        """Change the match state (start, pause, etc.)."""
+    def _apply(self, action: MatchAction) -> CurrentMatchState:
+        """Apply one action to the current match in its own transaction."""
         if self._current_match_id is None:
             raise ValueError("No active match")
 
-        with get_session() as session:
-            match = session.get(Match, self._current_match_id)
-            if match is None:
-                raise ValueError("Match not found")
-
-            old_state = match.match_state
-            match.match_state = change.new_state
-            match.updated_at = datetime.utcnow()
-            session.add(match)
+        live = self._live_snapshot(self._current_match_id)
+        if live is None:
+            raise ValueError("Match not found")
+
+        # Work on a copy so a failed write leaves the live values untouched
+        snapshot = replace(live)
+        now = self._now()
+        with self._session_scope() as session:
+            event_row = self._apply_action(snapshot.id, snapshot, action, now)
+            self._record_event(session, event_row)
+            snapshot.pending_events += 1
+            if self._needs_checkpoint(snapshot, action):
+                self._write_checkpoint(session, snapshot)
             session.commit()
 
-            # Record event
-            if match.id is not None:
-                self._record_event(
-                    session=session,
-                    match_id=match.id,
-                    event_type="STATE_CHANGE",
-                    round_number=match.current_round,
-                    blue_score_before=match.blue_score,
-                    red_score_before=match.red_score,
-                    blue_gam_jeom_before=match.blue_gam_jeom,
-                    red_gam_jeom_before=match.red_gam_jeom,
-                    blue_score_after=match.blue_score,
-                    red_score_after=match.red_score,
-                    blue_gam_jeom_after=match.blue_gam_jeom,
-                    red_gam_jeom_after=match.red_gam_jeom,
-                    notes=f"Match state changed from {old_state.value} to {change.new_state.value}",
-                )
-
-            return self.get_current_state()
+        self._live_match[snapshot.id] = snapshot
+        state = self._state_from_match(snapshot)
+        self._cache_state(snapshot.id, state)
 
-    def next_round(self, change: RoundChange) -> CurrentMatchState:
-        """Advance to the next round."""
+        return state
+
+    def _submit(self, action: MatchAction) -> asyncio.Future[CurrentMatchState]:
+        """Queue an action for the current match on the coalescing write queue."""
         if self._current_match_id is None:
             raise ValueError("No active match")
 
-        with get_session() as session:
-            match = session.get(Match, self._current_match_id)
-            if match is None:
-                raise ValueError("Match not found")
-
-            old_round = match.current_round
-            match.current_round = change.new_round
-            match.updated_at = datetime.utcnow()
-            session.add(match)
+        if self._flush_queue is None:
+            self._flush_queue = _FlushQueue(self._apply_queued)
+        return self._flush_queue.submit(self._current_match_id, action)
+
+    def _apply_queued(self, queued: list[tuple[int, MatchAction]]) -> list[CurrentMatchState]:
+        """Apply queued actions in order within one transaction and return the state after each.
+
+        All events go out in one multi-row INSERT, and each touched match is checkpointed at most
+        once, with its final values.
+        """
+        now = self._now()
+        states: list[CurrentMatchState] = []
+        event_rows: list[dict[str, Any]] = []
+        snapshots: dict[int, MatchSnapshot] = {}
+        checkpoint_ids: set[int] = set()
+        for match_id, action in queued:
+            snapshot = snapshots.get(match_id)
+            if snapshot is None:
+                live = self._live_snapshot(match_id)
+                if live is None:
+                    raise ValueError("Match not found")
+                snapshot = snapshots[match_id] = replace(live)
+
+            event_rows.append(self._apply_action(match_id, snapshot, action, now))
+            snapshot.pending_events += 1
+            if self._needs_checkpoint(snapshot, action):
+                checkpoint_ids.add(match_id)
+            states.append(self._state_from_match(snapshot))
+
+        with self._session_scope() as session:
+            session.execute(insert(_MATCH_EVENTS_TABLE), event_rows)
+            for match_id in checkpoint_ids:
+                self._write_checkpoint(session, snapshots[match_id])
             session.commit()
 
-            # Record event
-            if match.id is not None:
-                self._record_event(
-                    session=session,
-                    match_id=match.id,
-                    event_type="ROUND_CHANGE",
-                    round_number=change.new_round,
-                    blue_score_before=match.blue_score,
-                    red_score_before=match.red_score,
-                    blue_gam_jeom_before=match.blue_gam_jeom,
-                    red_gam_jeom_before=match.red_gam_jeom,
-                    blue_score_after=match.blue_score,
-                    red_score_after=match.red_score,
-                    blue_gam_jeom_after=match.blue_gam_jeom,
-                    red_gam_jeom_after=match.red_gam_jeom,
-                    notes=f"Round changed from {old_round} to {change.new_round}",
-                )
-
-            return self.get_current_state()
+        self._live_match.update(snapshots)
+        current = snapshots.get(self._current_match_id) if self._current_match_id is not None else None
+        if current is not None:
+            self._cache_state(current.id, self._state_from_match(current))
+
+        return states
+
+    @staticmethod
+    def _needs_checkpoint(snapshot: MatchSnapshot, action: MatchAction) -> bool:
+        """Checkpoint on match flow changes, and otherwise every CHECKPOINT_EVERY_EVENTS actions."""
+        match action:
+            case MatchStateChange() | RoundChange() | MatchReset():
+                return True
+            case _:
+                return snapshot.pending_events >= CHECKPOINT_EVERY_EVENTS
+
+    def _apply_action(self, match_id: int, match: MatchSnapshot, action: MatchAction, now: datetime) -> dict[str, Any]:
+        """Apply an action to the live match values and return its event row."""
+        match action:
+            case ScoreAction():
+                return self._apply_score(match_id, match, action, now)
+            case GamJeomAction():
+                return self._apply_gam_jeom(match_id, match, action, now)
+            case MatchStateChange():
+                return self._apply_state_change(match_id, match, action, now)
+            case RoundChange():
+                return self._apply_round_change(match_id, match, action, now)
+            case MatchReset():
+                return self._apply_reset(match_id, match, action, now)
+
+    def _apply_score(self, match_id: int, match: MatchSnapshot, action: ScoreAction, now: datetime) -> dict[str, Any]:
+        before = self._counters_before(match)
+
+        # Update score
+        if action.team_color == TeamColor.BLUE:
+            match.blue_score += action.points
+        else:
+            match.red_score += action.points
+
+        match.updated_at = now
+
+        return self._event_row(
+            match_id,
+            EventType.SCORE,
+            match.current_round,
+            now,
+            before,
+            self._counters_after(match),
+            team_color=action.team_color,
+            points_awarded=action.points,
+        )
 
-    def reset_match(self, reset_action: MatchReset) -> CurrentMatchState:
-        """Reset all match scores and counts."""
-        if self._current_match_id is None:
-            raise ValueError("No active match")
+    def _apply_gam_jeom(
+        self, match_id: int, match: MatchSnapshot, action: GamJeomAction, now: datetime
+    ) -> dict[str, Any]:
+        before = self._counters_before(match)
+
+        # Apply penalty and award point to opponent
+        if action.penalized_team == TeamColor.BLUE:
+            match.blue_gam_jeom += 1
+            match.red_score += 1  # Opposing team gets a point
+        else:
+            match.red_gam_jeom += 1
+            match.blue_score += 1  # Opposing team gets a point
+
+        match.updated_at = now
+
+        return self._event_row(
+            match_id,
+            EventType.GAM_JEOM,
+            match.current_round,
+            now,
+            before,
+            self._counters_after(match),
+            team_color=action.penalized_team,
+            points_awarded=1,
+            notes=action.notes,
+        )
 
-        with get_session() as session:
-            match = session.get(Match, self._current_match_id)
-            if match is None:
-                raise ValueError("Match not found")
+    def _apply_state_change(
+        self, match_id: int, match: MatchSnapshot, change: MatchStateChange, now: datetime
+    ) -> dict[str, Any]:
+        before = self._counters_before(match)
+
+        match.match_state = change.new_state
+        match.updated_at = now
+
+        return self._event_row(
+            match_id,
+            EventType.STATE_CHANGE,
+            match.current_round,
+            now,
+            before,
+            self._counters_after(match),
+            notes=change.notes,
+        )
 
-            # Store before state for event logging
-            blue_before = match.blue_score
-            red_before = match.red_score
-            blue_gj_before = match.blue_gam_jeom
-            red_gj_before = match.red_gam_jeom
-            round_before = match.current_round
-
-            # Reset all values
-            match.blue_score = 0
-            match.red_score = 0
-            match.blue_gam_jeom = 0
-            match.red_gam_jeom = 0
-            match.current_round = 1
-            match.match_state = MatchState.NOT_STARTED
-            match.updated_at = datetime.utcnow()
-            session.add(match)
-            session.commit()
+    def _apply_round_change(
+        self, match_id: int, match: MatchSnapshot, change: RoundChange, now: datetime
+    ) -> dict[str, Any]:
+        before = self._counters_before(match)
+
+        match.current_round = change.new_round
+        match.updated_at = now
+
+        return self._event_row(
+            match_id,
+            EventType.ROUND_CHANGE,
+            change.new_round,
+            now,
+            before,
+            self._counters_after(match),
+        )
+
+    def _apply_reset(
+        self, match_id: int, match: MatchSnapshot, reset_action: MatchReset, now: datetime
+    ) -> dict[str, Any]:
+        before = self._counters_before(match)
+
+        # Reset all values
+        match.blue_score = 0
+        match.red_score = 0
+        match.blue_gam_jeom = 0
+        match.red_gam_jeom = 0
+        match.current_round = 1
+        match.match_state = MatchState.NOT_STARTED
+        match.updated_at = now
+
+        return self._event_row(
+            match_id,
+            EventType.RESET,
+            1,
+            now,
+            before,
+            self._counters_after(match),
+            notes=reset_action.notes,
+        )
 
-            # Record event
-            if match.id is not None:
-                self._record_event(
-                    session=session,
-                    match_id=match.id,
-                    event_type="RESET",
-                    round_number=1,
-                    blue_score_before=blue_before,
-                    red_score_before=red_before,
-                    blue_gam_jeom_before=blue_gj_before,
-                    red_gam_jeom_before=red_gj_before,
-                    blue_score_after=0,
-                    red_score_after=0,
-                    blue_gam_jeom_after=0,
-                    red_gam_jeom_after=0,
-                    notes=f"Match reset: Scores {blue_before}-{red_before}, Gam-Jeom {blue_gj_before}-{red_gj_before}, Round {round_before} → All reset to 0-0, 0-0, Round 1",
-                )
-
-            return self.get_current_state()
-
-    def _record_event(
+    def _created_event_row(self, snapshot: MatchSnapshot, now: datetime) -> dict[str, Any]:
+        return self._event_row(
+            snapshot.id,
+            EventType.MATCH_CREATED,
+            snapshot.current_round,
+            now,
+            self._counters_before(snapshot),
+            self._counters_after(snapshot),
+        )
+
+    @staticmethod
+    def _counters_before(match: MatchSnapshot) -> dict[str, Any]:
+        return {
+            "round_before": match.current_round,
+            "match_state_before": match.match_state,
+            "blue_score_before": match.blue_score,
+            "red_score_before": match.red_score,
+            "blue_gam_jeom_before": match.blue_gam_jeom,
+            "red_gam_jeom_before": match.red_gam_jeom,
+        }
+
+    @staticmethod
+    def _counters_after(match: MatchSnapshot) -> dict[str, Any]:
+        return {
+            "match_state_after": match.match_state,
+            "blue_score_after": match.blue_score,
+            "red_score_after": match.red_score,
+            "blue_gam_jeom_after": match.blue_gam_jeom,
+            "red_gam_jeom_after": match.red_gam_jeom,
+        }
+
+    def _event_row(
         self,
-        session: Session,
         match_id: int,
-        event_type: str,
+        event_type: EventType,
         round_number: int,
-        blue_score_before: int,
-        red_score_before: int,
-        blue_gam_jeom_before: int,
-        red_gam_jeom_before: int,
-        blue_score_after: int,
-        red_score_after: int,
-        blue_gam_jeom_after: int,
-        red_gam_jeom_after: int,
+        created_at: datetime,
+        before: dict[str, Any],
+        after: dict[str, Any],
         team_color: Optional[TeamColor] = None,
         points_awarded: int = 0,
         notes: Optional[str] = None,
-    ) -> None:
-        """Record a match event for audit trail."""
-        event = MatchEvent(
-            match_id=match_id,
-            event_type=event_type,
-            team_color=team_color,
-            points_awarded=points_awarded,
-            round_number=round_number,
-            blue_score_before=blue_score_before,
-            red_score_before=red_score_before,
-            blue_gam_jeom_before=blue_gam_jeom_before,
-            red_gam_jeom_before=red_gam_jeom_before,
-            blue_score_after=blue_score_after,
-            red_score_after=red_score_after,
-            blue_gam_jeom_after=blue_gam_jeom_after,
-            red_gam_jeom_after=red_gam_jeom_after,
-            notes=notes,
+    ) -> dict[str, Any]:
+        """Build the column values of one audit event from the counters before and after it.
+
+        Events are write-only audit rows built from trusted service values, so they skip model
+        validation and are inserted with a Core INSERT instead of the ORM unit of work.
+        """
+        return asdict(
+            _MatchEventRow(
+                match_id=match_id,
+                event_type=event_type,
+                team_color=team_color,
+                points_awarded=points_awarded,
+                round_number=round_number,
+                notes=notes,
+                created_at=created_at,
+                **before,
+                **after,
+            )
         )
-        session.add(event)
-        session.commit()
+
+    def _record_event(self, session: Session, event_row: dict[str, Any]) -> None:
+        """Record a match event for audit trail."""
+        if self._event_batch is not None:
+            self._event_batch.append(event_row)
+            return
+        session.execute(insert(_MATCH_EVENTS_TABLE), [event_row])
+
+
+class _FlushQueue:
+    """Coalesces actions submitted within a short window into one write transaction.
+
+    A batch is flushed when it reaches max_batch actions or max_delay_ms after its first action.
+    Flushes run one at a time on a worker thread, so actions are applied in submission order.
+    """
+
+    def __init__(
+        self,
+        apply: Callable[[list[tuple[int, MatchAction]]], list[CurrentMatchState]],
+        max_batch: int = FLUSH_MAX_BATCH,
+        max_delay_ms: float = FLUSH_MAX_DELAY_MS,
+    ):
+        self._apply = apply
+        self._max_batch = max_batch
+        self._max_delay = max_delay_ms / 1000
+        self._pending: list[tuple[int, MatchAction, asyncio.Future[CurrentMatchState]]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def submit(self, match_id: int, action: MatchAction) -> asyncio.Future[CurrentMatchState]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[CurrentMatchState] = loop.create_future()
+        self._pending.append((match_id, action, future))
+
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def drain(self) -> None:
+        """Flush the pending actions now and wait until every flush has finished."""
+        self._flush()
+        while self._tasks:
+            # _run() reports its errors through the callers' futures
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run(self, batch: list[tuple[int, MatchAction, asyncio.Future[CurrentMatchState]]]) -> None:
+        async with self._lock:
+            queued = [(match_id, action) for match_id, action, _ in batch]
+            try:
+                states = await asyncio.get_running_loop().run_in_executor(DB_EXECUTOR, self._apply, queued)
+            except Exception as e:
+                logger.error("Error flushing %d queued match actions: %s", len(batch), e)
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            for (_, _, future), state in zip(batch, states):
+                if not future.done():
+                    future.set_result(state)
 
 
 # Global service instance
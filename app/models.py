@@ -1,7 +1,14 @@
-from sqlmodel import SQLModel, Field
-from datetime import datetime
-from typing import Optional
-from enum import Enum
+from sqlalchemy import Column, SmallInteger
+from sqlalchemy.types import TypeDecorator
+from sqlmodel import SQLModel, Field, Index
+from datetime import datetime, timezone
+from typing import Any, Final, Mapping, Optional
+from enum import Enum, IntEnum
+
+
+def utc_now() -> datetime:
+    """Current UTC time as a naive datetime, the convention of every timestamp column"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 class TeamColor(str, Enum):
@@ -11,6 +18,10 @@ class TeamColor(str, Enum):
     RED = "RED"
 
 
+# The team that benefits from the other team's Gam-Jeom
+OPPONENT: Final[dict[TeamColor, TeamColor]] = {TeamColor.BLUE: TeamColor.RED, TeamColor.RED: TeamColor.BLUE}
+
+
 class MatchState(str, Enum):
     """Enum for match states"""
 
@@ -20,6 +31,54 @@ class MatchState(str, Enum):
     FINISHED = "FINISHED"
 
 
+# Small integers the match states are stored as; the API keeps the names
+MATCH_STATE_CODES: Final[dict[MatchState, int]] = {
+    MatchState.NOT_STARTED: 1,
+    MatchState.RUNNING: 2,
+    MatchState.PAUSED: 3,
+    MatchState.FINISHED: 4,
+}
+
+
+class EventType(IntEnum):
+    """Enum for match event types, stored as small integers"""
+
+    MATCH_CREATED = 1
+    SCORE = 2
+    GAM_JEOM = 3
+    STATE_CHANGE = 4
+    ROUND_CHANGE = 5
+    RESET = 6
+
+    def __str__(self) -> str:
+        # Serialize by name, as event types were exposed when they were stored as text
+        return self.name
+
+
+class IntEnumType(TypeDecorator):
+    """SMALLINT column that reads back as members of the given enum
+
+    Members of an IntEnum are stored as their values; any other enum needs a mapping of its members
+    to codes.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[Enum], codes: Optional[Mapping[Any, int]] = None):
+        super().__init__()
+        self.enum_class = enum_class
+        # Kept private: the cache key is built from the public constructor arguments, which must be hashable
+        self._codes = dict(codes) if codes is not None else {member: int(member.value) for member in enum_class}
+        self._members = {code: member for member, code in self._codes.items()}
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else self._codes[self.enum_class(value)]
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else self._members[value]
+
+
 # Persistent models (stored in database)
 class Match(SQLModel, table=True):
     """Main match record with teams and overall match information"""
@@ -32,22 +91,39 @@ class Match(SQLModel, table=True):
     blue_gam_jeom: int = Field(default=0, ge=0)
     red_gam_jeom: int = Field(default=0, ge=0)
     current_round: int = Field(default=1, ge=1)
-    match_state: MatchState = Field(default=MatchState.NOT_STARTED)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    match_state: MatchState = Field(
+        default=MatchState.NOT_STARTED, sa_column=Column(IntEnumType(MatchState, MATCH_STATE_CODES), nullable=False)
+    )
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
+    # Id of the newest match_events row the checkpointed values above include
+    last_event_id: int = Field(default=0, ge=0)
 
 
 class MatchEvent(SQLModel, table=True):
     """Records all events that happen during a match for audit trail"""
 
     __tablename__ = "match_events"  # type: ignore[assignment]
+    # Audit-trail reads scan one match's events in insertion order; on PostgreSQL the index also covers
+    # the columns commonly shown alongside them
+    __table_args__ = (
+        Index(
+            "ix_match_events_match_id_id",
+            "match_id",
+            "id",
+            postgresql_include=["event_type", "round_number"],
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     match_id: int = Field(foreign_key="matches.id")
-    event_type: str = Field(max_length=50)  # "SCORE", "GAM_JEOM", "ROUND_CHANGE", "STATE_CHANGE", "RESET"
+    event_type: EventType = Field(sa_column=Column(IntEnumType(EventType), nullable=False))
     team_color: Optional[TeamColor] = Field(default=None)
     points_awarded: int = Field(default=0)
     round_number: int = Field(ge=1)
+    round_before: int = Field(ge=1)
+    match_state_before: MatchState = Field(sa_column=Column(IntEnumType(MatchState, MATCH_STATE_CODES), nullable=False))
+    match_state_after: MatchState = Field(sa_column=Column(IntEnumType(MatchState, MATCH_STATE_CODES), nullable=False))
     blue_score_before: int = Field(ge=0)
     red_score_before: int = Field(ge=0)
     blue_gam_jeom_before: int = Field(ge=0)
@@ -56,8 +132,37 @@ class MatchEvent(SQLModel, table=True):
     red_score_after: int = Field(ge=0)
     blue_gam_jeom_after: int = Field(ge=0)
     red_gam_jeom_after: int = Field(ge=0)
-    notes: Optional[str] = Field(default=None, max_length=500)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    notes: Optional[str] = Field(default=None, max_length=500)  # user-supplied notes only
+    created_at: datetime = Field(default_factory=utc_now)
+
+    def describe(self) -> str:
+        """Human-readable description built from the structured event columns"""
+        match self.event_type:
+            case EventType.MATCH_CREATED:
+                description = "New match created"
+            case EventType.SCORE if self.team_color is not None:
+                description = f"{self.team_color.value} team scored {self.points_awarded} points"
+            case EventType.GAM_JEOM if self.team_color is not None:
+                opponent = OPPONENT[self.team_color]
+                description = f"Gam-Jeom penalty for {self.team_color.value}, point awarded to {opponent.value}"
+            case EventType.STATE_CHANGE:
+                description = (
+                    f"Match state changed from {self.match_state_before.name} to {self.match_state_after.name}"
+                )
+            case EventType.ROUND_CHANGE:
+                description = f"Round changed from {self.round_before} to {self.round_number}"
+            case EventType.RESET:
+                description = (
+                    f"Match reset: Scores {self.blue_score_before}-{self.red_score_before}, "
+                    f"Gam-Jeom {self.blue_gam_jeom_before}-{self.red_gam_jeom_before}, Round {self.round_before} "
+                    "→ All reset to 0-0, 0-0, Round 1"
+                )
+            case _:
+                description = str(self.event_type)
+
+        if self.notes:
+            return f"{description} ({self.notes})"
+        return description
 
 
 # Non-persistent schemas (for validation, forms, API requests/responses)
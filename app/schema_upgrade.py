@@ -0,0 +1,151 @@
+"""In-place upgrades of databases created by earlier versions of the app.
+
+create_all() only creates missing tables and never alters existing ones. Every step below checks
+whether its change is still missing, so upgrade_schema() runs safely on every start. Only PostgreSQL,
+the deployment database, is upgraded; SQLite databases are test or scratch databases created fresh.
+"""
+
+import logging
+import re
+from typing import Callable, Final
+
+from sqlalchemy import Connection, inspect, text
+
+from app.models import MATCH_STATE_CODES, EventType, MatchEvent, MatchState
+
+logger = logging.getLogger(__name__)
+
+# Earlier versions kept no transition columns, only these generated notes
+_STATES: Final = "|".join(state.name for state in MatchState)
+_STATE_CHANGE_NOTES: Final = re.compile(rf"Match state changed from ({_STATES}) to ({_STATES})")
+_ROUND_CHANGE_NOTES: Final = re.compile(r"Round changed from (\d+) to")
+_RESET_NOTES: Final = re.compile(r"Round (\d+) →")
+
+
+def upgrade_schema(conn: Connection) -> None:
+    """Bring tables created by an earlier version up to the current models, in one transaction."""
+    if conn.dialect.name != "postgresql":
+        return
+
+    for step in _STEPS:
+        step(conn)
+
+
+def _column_types(conn: Connection, table: str) -> dict[str, str]:
+    return {column["name"]: str(column["type"]) for column in inspect(conn).get_columns(table)}
+
+
+def _event_type_as_smallint(conn: Connection) -> None:
+    """Event types were stored as their names in a VARCHAR column."""
+    if _column_types(conn, "match_events")["event_type"] == "SMALLINT":
+        return
+
+    codes = " ".join(f"WHEN '{member.name}' THEN {member.value}" for member in EventType)
+    conn.execute(
+        text(f"ALTER TABLE match_events ALTER COLUMN event_type TYPE SMALLINT USING CASE event_type {codes} END")
+    )
+    logger.info("Converted match_events.event_type to SMALLINT")
+
+
+def _match_state_as_smallint(conn: Connection) -> None:
+    """Match states were stored in the native matchstate enum type."""
+    if _column_types(conn, "matches")["match_state"] == "SMALLINT":
+        return
+
+    codes = " ".join(f"WHEN '{state.name}' THEN {code}" for state, code in MATCH_STATE_CODES.items())
+    conn.execute(
+        text(f"ALTER TABLE matches ALTER COLUMN match_state TYPE SMALLINT USING CASE match_state::text {codes} END")
+    )
+    conn.execute(text("DROP TYPE IF EXISTS matchstate"))
+    logger.info("Converted matches.match_state to SMALLINT")
+
+
+def _event_transitions(conn: Connection) -> None:
+    """Events record the round and match state they started from and the state they left.
+
+    Earlier versions only wrote these into the notes, so each match's events are replayed in order
+    and the values recovered from them. Those notes were always generated, never typed by a user, and
+    describe() now builds the same text from the columns, so they are cleared.
+    """
+    if "round_before" in _column_types(conn, "match_events"):
+        return
+
+    conn.execute(
+        text(
+            "ALTER TABLE match_events ADD COLUMN round_before INTEGER, "
+            "ADD COLUMN match_state_before SMALLINT, ADD COLUMN match_state_after SMALLINT"
+        )
+    )
+    rows = conn.execute(
+        text("SELECT id, match_id, event_type, round_number, notes FROM match_events ORDER BY match_id, id")
+    )
+    updates = []
+    match_id, state = None, MatchState.NOT_STARTED
+    for row in rows:
+        if row.match_id != match_id:
+            match_id, state = row.match_id, MatchState.NOT_STARTED
+        state_before, round_before, notes = state, row.round_number, row.notes or ""
+        if row.event_type == EventType.STATE_CHANGE and (found := _STATE_CHANGE_NOTES.search(notes)):
+            state_before, state = MatchState[found[1]], MatchState[found[2]]
+        elif row.event_type == EventType.ROUND_CHANGE and (found := _ROUND_CHANGE_NOTES.search(notes)):
+            round_before = int(found[1])
+        elif row.event_type == EventType.RESET:
+            state = MatchState.NOT_STARTED
+            if found := _RESET_NOTES.search(notes):
+                round_before = int(found[1])
+
+        updates.append(
+            {
+                "id": row.id,
+                "round_before": round_before,
+                "state_before": MATCH_STATE_CODES[state_before],
+                "state_after": MATCH_STATE_CODES[state],
+            }
+        )
+
+    if updates:
+        conn.execute(
+            text(
+                "UPDATE match_events SET round_before = :round_before, match_state_before = :state_before, "
+                "match_state_after = :state_after, notes = NULL WHERE id = :id"
+            ),
+            updates,
+        )
+    conn.execute(
+        text(
+            "ALTER TABLE match_events ALTER COLUMN round_before SET NOT NULL, "
+            "ALTER COLUMN match_state_before SET NOT NULL, ALTER COLUMN match_state_after SET NOT NULL"
+        )
+    )
+    logger.info("Recovered the transitions of %d match events from their notes", len(updates))
+
+
+def _event_indexes(conn: Connection) -> None:
+    """Event tables of earlier versions had no indexes."""
+    for index in MatchEvent.__table__.indexes:  # type: ignore[attr-defined]
+        index.create(conn, checkfirst=True)
+
+
+def _match_checkpoints(conn: Connection) -> None:
+    """Matches record the last event their scores include; earlier versions kept every row up to date."""
+    if "last_event_id" in _column_types(conn, "matches"):
+        return
+
+    conn.execute(text("ALTER TABLE matches ADD COLUMN last_event_id INTEGER NOT NULL DEFAULT 0"))
+    conn.execute(
+        text(
+            "UPDATE matches SET last_event_id = "
+            "COALESCE((SELECT MAX(id) FROM match_events WHERE match_id = matches.id), 0)"
+        )
+    )
+    logger.info("Added matches.last_event_id")
+
+
+# Applied in order; a later step may rely on the columns an earlier one converted or added
+_STEPS: Final[tuple[Callable[[Connection], None], ...]] = (
+    _event_type_as_smallint,
+    _match_state_as_smallint,
+    _event_transitions,
+    _event_indexes,
+    _match_checkpoints,
+)
@@ -1,157 +1,184 @@
 """Main scoring UI for Taekwondo matches."""
 
+import asyncio
 import logging
+from functools import partial
 from nicegui import ui
-from typing import Optional
-from app.match_service import match_service
-from app.models import TeamColor, ScoreAction, GamJeomAction, MatchStateChange, RoundChange, MatchReset, MatchState
+from typing import Any, Awaitable, Callable, Final, Mapping, Optional
+from app.match_service import DB_EXECUTOR, match_service
+from app.models import (
+    OPPONENT,
+    TeamColor,
+    ScoreAction,
+    GamJeomAction,
+    MatchStateChange,
+    RoundChange,
+    MatchReset,
+    MatchState,
+    CurrentMatchState,
+)
 
 logger = logging.getLogger(__name__)
 
+# Dark full-screen page background, shared by every page
+_HEAD_CSS = (
+    "<style>"
+    "body { background-color: #000000 !important; margin: 0; padding: 0; font-family: 'Roboto', sans-serif; }"
+    ".q-page { background-color: #000000 !important; min-height: 100vh; }"
+    "</style>"
+)
+
+_SCORE_BTN_CLS_BLUE = (
+    "bg-white text-blue-600 text-2xl font-bold px-8 py-4 rounded-xl shadow-lg hover:bg-gray-100 transition-all"
+)
+_SCORE_BTN_CLS_RED = (
+    "bg-white text-red-600 text-2xl font-bold px-8 py-4 rounded-xl shadow-lg hover:bg-gray-100 transition-all"
+)
+_SCORE_BTN_STYLE = "min-width: 80px; min-height: 60px;"
+# (text, points) of the score buttons in a team panel, left to right
+_SCORE_BTN_SPECS = (("+1", 1), ("+3", 3))
+_GAMJEOM_BTN_CLS = (
+    "bg-red-500 text-white text-xl font-bold px-6 py-3 rounded-lg shadow-lg hover:bg-red-600 transition-all mt-4"
+)
+_GAMJEOM_BTN_STYLE = "min-width: 140px; min-height: 50px;"
+_CTRL_BTN_CLS_START = (
+    "bg-green-500 text-white text-xl font-bold px-8 py-4 rounded-lg shadow-lg hover:bg-green-600 transition-all"
+)
+_CTRL_BTN_CLS_PAUSE = (
+    "bg-yellow-500 text-white text-xl font-bold px-8 py-4 rounded-lg shadow-lg hover:bg-yellow-600 transition-all"
+)
+_CTRL_BTN_CLS_RESET = (
+    "bg-red-500 text-white text-xl font-bold px-8 py-4 rounded-lg shadow-lg hover:bg-red-600 transition-all"
+)
+_CTRL_BTN_CLS_NEXT_ROUND = (
+    "bg-blue-500 text-white text-xl font-bold px-8 py-4 rounded-lg shadow-lg hover:bg-blue-600 transition-all"
+)
+_CTRL_BTN_STYLE = "min-width: 120px;"
+_CTRL_BTN_STYLE_WIDE = "min-width: 140px;"
+_DIGIT_STYLE = "text-shadow: 2px 2px 4px rgba(0,0,0,0.3);"
+
+_THEME_COLORS = {
+    "primary": "#1976d2",
+    "secondary": "#424242",
+    "accent": "#82b1ff",
+    "dark": "#121212",
+    "positive": "#21ba45",
+    "negative": "#c10015",
+    "info": "#31ccec",
+    "warning": "#f2c037",
+}
+
+_DISPLAY_FIELDS: Final = ("blue_score", "blue_gam_jeom", "red_score", "red_gam_jeom", "current_round")
+# Display text of state fields that are not shown as plain numbers
+_FORMATTERS: Final[Mapping[str, Callable[[Any], str]]] = {"current_round": "ROUND {}".format}
+
+
+def _safe_handler(error_msg: str) -> Callable[[Callable[..., Awaitable[None]]], Callable[..., Awaitable[None]]]:
+    """Run a click handler with the current match ID and report its errors as notifications.
+
+    The handler is skipped while there is no match. error_msg is formatted with the handler's arguments.
+    """
+
+    def decorator(handler: Callable[..., Awaitable[None]]) -> Callable[..., Awaitable[None]]:
+        async def wrapper(self: "ScoringUI", *args: Any) -> None:
+            try:
+                match_id = match_service.get_current_match_id()
+                if match_id is None:
+                    return
+                await handler(self, match_id, *args)
+            except Exception as e:
+                message = error_msg.format(*args)
+                logger.error("%s: %s", message, e)
+                ui.notify(f"{message}: {str(e)}", type="negative")
+
+        # Not functools.wraps: NiceGUI reads the handler signature to decide whether to pass event
+        # arguments, so it must see the wrapper's own signature rather than the wrapped one
+        wrapper.__name__ = handler.__name__
+        wrapper.__qualname__ = handler.__qualname__
+        wrapper.__doc__ = handler.__doc__
+        return wrapper
+
+    return decorator
+
 
 class ScoringUI:
     """Main scoring UI controller with reactive state management."""
 
     def __init__(self):
         self.current_state = None
-        self.blue_score_label: Optional[ui.label] = None
-        self.red_score_label: Optional[ui.label] = None
-        self.blue_gam_jeom_label: Optional[ui.label] = None
-        self.red_gam_jeom_label: Optional[ui.label] = None
-        self.round_label: Optional[ui.label] = None
+        # Display texts keyed by the CurrentMatchState field they show; the labels are bound to it,
+        # so every open page follows it
+        self.model: dict[str, str] = self._display_texts(CurrentMatchState())
+        # State shown ahead of the queued writes that have not been committed yet
+        self._optimistic_state: Optional[CurrentMatchState] = None
+        self._pending_writes = 0
 
     def create(self):
         """Create and configure the scoring UI page."""
+        # Set dark background for entire page, once for all clients
+        ui.add_head_html(_HEAD_CSS, shared=True)
 
         @ui.page("/")
-        def scoring_page():
-            # Apply dark theme and full-screen layout
-            ui.colors(
-                primary="#1976d2",
-                secondary="#424242",
-                accent="#82b1ff",
-                dark="#121212",
-                positive="#21ba45",
-                negative="#c10015",
-                info="#31ccec",
-                warning="#f2c037",
-            )
+        async def scoring_page():
+            # Apply dark theme; colors are a per-client element, so they are set on each page
+            ui.colors(**_THEME_COLORS)
 
-            # Set dark background for entire page
-            ui.add_head_html("""
-                <style>
-                    body { 
-                        background-color: #000000 !important; 
-                        margin: 0; 
-                        padding: 0; 
-                        font-family: 'Roboto', sans-serif;
-                    }
-                    .q-page { 
-                        background-color: #000000 !important; 
-                        min-height: 100vh;
-                    }
-                </style>
-            """)
-
-            # Initialize match if needed
-            if match_service.get_current_match_id() is None:
-                match_service.create_new_match()
+            # Initialize match if needed; database work stays off the event loop
+            await asyncio.get_running_loop().run_in_executor(DB_EXECUTOR, match_service.ensure_current_match)
+
+            # Initial state update, before the labels bind to it
+            self._update_model(await self._committed_state())
 
             # Create main layout
             self._create_main_layout()
 
-            # Initial state update
-            self._update_display()
-
     def _create_main_layout(self):
         """Create the main UI layout with scoring panels."""
         with ui.column().classes("w-full h-screen"):
             # Main scoring area (top 80%)
             with ui.row().classes("w-full flex-1 gap-0"):
                 # Blue team panel (left)
-                self._create_blue_panel()
+                self._create_team_panel(TeamColor.BLUE, "bg-blue-600", _SCORE_BTN_CLS_BLUE)
 
                 # Center match info panel
                 self._create_center_panel()
 
                 # Red team panel (right)
-                self._create_red_panel()
+                self._create_team_panel(TeamColor.RED, "bg-red-600", _SCORE_BTN_CLS_RED)
 
             # Control panel (bottom 20%)
             self._create_control_panel()
 
-    def _create_blue_panel(self):
-        """Create the blue team scoring panel."""
-        with ui.column().classes("w-1/3 h-full bg-blue-600 flex items-center justify-center p-8"):
+    def _create_team_panel(self, team: TeamColor, bg_cls: str, score_btn_cls: str):
+        """Create the scoring panel of one team."""
+        prefix = team.value.lower()
+        with ui.column().classes(f"w-1/3 h-full {bg_cls} flex items-center justify-center p-8"):
             # Team label
-            ui.label("BLUE").classes("text-white text-4xl font-bold mb-4").style("letter-spacing: 4px;")
+            ui.label(team.value).classes("text-white text-4xl font-bold mb-4").style("letter-spacing: 4px;")
 
             # Score display
-            self.blue_score_label = (
-                ui.label("0")
-                .classes("text-white text-9xl font-bold mb-6")
-                .style("text-shadow: 2px 2px 4px rgba(0,0,0,0.3);")
-            )
+            ui.label().classes("text-white text-9xl font-bold mb-6").style(_DIGIT_STYLE).bind_text_from(
+                self.model, f"{prefix}_score"
+            ).mark(f"{prefix}_score")
 
             # Gam-Jeom section
             ui.label("GAM-JEOM").classes("text-white text-2xl font-semibold mb-2").style("letter-spacing: 2px;")
-            self.blue_gam_jeom_label = (
-                ui.label("0")
-                .classes("text-white text-6xl font-bold mb-8")
-                .style("text-shadow: 2px 2px 4px rgba(0,0,0,0.3);")
+            ui.label().classes("text-white text-6xl font-bold mb-8").style(_DIGIT_STYLE).bind_text_from(
+                self.model, f"{prefix}_gam_jeom"
             )
 
             # Action buttons
             with ui.row().classes("gap-4"):
-                ui.button("+1", on_click=lambda: self._add_blue_score(1)).classes(
-                    "bg-white text-blue-600 text-2xl font-bold px-8 py-4 rounded-xl shadow-lg hover:bg-gray-100 transition-all"
-                ).style("min-width: 80px; min-height: 60px;")
-
-                ui.button("+3", on_click=lambda: self._add_blue_score(3)).classes(
-                    "bg-white text-blue-600 text-2xl font-bold px-8 py-4 rounded-xl shadow-lg hover:bg-gray-100 transition-all"
-                ).style("min-width: 80px; min-height: 60px;")
+                for text, points in _SCORE_BTN_SPECS:
+                    ui.button(text, on_click=partial(self._add_score, team, points)).classes(score_btn_cls).style(
+                        _SCORE_BTN_STYLE
+                    ).mark(f"{prefix}_add_{points}")
 
             # Gam-Jeom button
-            ui.button("Gam-Jeom", on_click=lambda: self._add_blue_gam_jeom()).classes(
-                "bg-red-500 text-white text-xl font-bold px-6 py-3 rounded-lg shadow-lg hover:bg-red-600 transition-all mt-4"
-            ).style("min-width: 140px; min-height: 50px;")
-
-    def _create_red_panel(self):
-        """Create the red team scoring panel."""
-        with ui.column().classes("w-1/3 h-full bg-red-600 flex items-center justify-center p-8"):
-            # Team label
-            ui.label("RED").classes("text-white text-4xl font-bold mb-4").style("letter-spacing: 4px;")
-
-            # Score display
-            self.red_score_label = (
-                ui.label("0")
-                .classes("text-white text-9xl font-bold mb-6")
-                .style("text-shadow: 2px 2px 4px rgba(0,0,0,0.3);")
-            )
-
-            # Gam-Jeom section
-            ui.label("GAM-JEOM").classes("text-white text-2xl font-semibold mb-2").style("letter-spacing: 2px;")
-            self.red_gam_jeom_label = (
-                ui.label("0")
-                .classes("text-white text-6xl font-bold mb-8")
-                .style("text-shadow: 2px 2px 4px rgba(0,0,0,0.3);")
+            ui.button("Gam-Jeom", on_click=partial(self._add_gam_jeom, team)).classes(_GAMJEOM_BTN_CLS).style(
+                _GAMJEOM_BTN_STYLE
             )
 
-            # Action buttons
-            with ui.row().classes("gap-4"):
-                ui.button("+1", on_click=lambda: self._add_red_score(1)).classes(
-                    "bg-white text-red-600 text-2xl font-bold px-8 py-4 rounded-xl shadow-lg hover:bg-gray-100 transition-all"
-                ).style("min-width: 80px; min-height: 60px;")
-
-                ui.button("+3", on_click=lambda: self._add_red_score(3)).classes(
-                    "bg-white text-red-600 text-2xl font-bold px-8 py-4 rounded-xl shadow-lg hover:bg-gray-100 transition-all"
-                ).style("min-width: 80px; min-height: 60px;")
-
-            # Gam-Jeom button
-            ui.button("Gam-Jeom", on_click=lambda: self._add_red_gam_jeom()).classes(
-                "bg-red-500 text-white text-xl font-bold px-6 py-3 rounded-lg shadow-lg hover:bg-red-600 transition-all mt-4"
-            ).style("min-width: 140px; min-height: 50px;")
-
     def _create_center_panel(self):
         """Create the center match information panel."""
         with ui.column().classes("w-1/3 h-full bg-black flex items-center justify-center p-8"):
@@ -161,195 +188,155 @@ class ScoringUI:
             )
 
             # Round display
-            self.round_label = (
-                ui.label("ROUND 1")
-                .classes("text-white text-4xl font-semibold")
-                .style("letter-spacing: 4px; text-shadow: 2px 2px 4px rgba(255,255,255,0.1);")
-            )
+            ui.label().classes("text-white text-4xl font-semibold").style(
+                "letter-spacing: 4px; text-shadow: 2px 2px 4px rgba(255,255,255,0.1);"
+            ).bind_text_from(self.model, "current_round")
 
     def _create_control_panel(self):
         """Create the bottom control panel."""
         with ui.row().classes("w-full bg-gray-700 h-24 flex items-center justify-center gap-8 px-8"):
-            ui.button("Start", on_click=self._start_match).classes(
-                "bg-green-500 text-white text-xl font-bold px-8 py-4 rounded-lg shadow-lg hover:bg-green-600 transition-all"
-            ).style("min-width: 120px;")
+            ui.button("Start", on_click=self._start_match).classes(_CTRL_BTN_CLS_START).style(_CTRL_BTN_STYLE)
 
-            ui.button("Pause", on_click=self._pause_match).classes(
-                "bg-yellow-500 text-white text-xl font-bold px-8 py-4 rounded-lg shadow-lg hover:bg-yellow-600 transition-all"
-            ).style("min-width: 120px;")
+            ui.button("Pause", on_click=self._pause_match).classes(_CTRL_BTN_CLS_PAUSE).style(_CTRL_BTN_STYLE)
 
-            ui.button("Reset", on_click=self._reset_match).classes(
-                "bg-red-500 text-white text-xl font-bold px-8 py-4 rounded-lg shadow-lg hover:bg-red-600 transition-all"
-            ).style("min-width: 120px;")
+            ui.button("Reset", on_click=self._reset_match).classes(_CTRL_BTN_CLS_RESET).style(_CTRL_BTN_STYLE)
 
-            ui.button("Next Round", on_click=self._next_round).classes(
-                "bg-blue-500 text-white text-xl font-bold px-8 py-4 rounded-lg shadow-lg hover:bg-blue-600 transition-all"
-            ).style("min-width: 140px;")
-
-    def _add_blue_score(self, points: int):
-        """Add points to blue team score."""
-        try:
-            match_id = match_service.get_current_match_id()
-            if match_id is None:
-                return
-
-            action = ScoreAction(team_color=TeamColor.BLUE, points=points, match_id=match_id)
-            match_service.add_score(action)
-            self._update_display()
-        except Exception as e:
-            logger.error(f"Error adding blue score: {str(e)}")
-            ui.notify(f"Error adding blue score: {str(e)}", type="negative")
-
-    def _add_red_score(self, points: int):
-        """Add points to red team score."""
-        try:
-            match_id = match_service.get_current_match_id()
-            if match_id is None:
-                return
-
-            action = ScoreAction(team_color=TeamColor.RED, points=points, match_id=match_id)
-            match_service.add_score(action)
-            self._update_display()
-        except Exception as e:
-            logger.error(f"Error adding red score: {str(e)}")
-            ui.notify(f"Error adding red score: {str(e)}", type="negative")
-
-    def _add_blue_gam_jeom(self):
-        """Add Gam-Jeom penalty to blue team."""
-        try:
-            match_id = match_service.get_current_match_id()
-            if match_id is None:
-                return
-
-            action = GamJeomAction(penalized_team=TeamColor.BLUE, match_id=match_id, notes="Blue team Gam-Jeom penalty")
-            match_service.add_gam_jeom(action)
-            self._update_display()
-
-            # Show confirmation dialog
-            ui.notify(
-                "Gam-Jeom penalty applied to BLUE team. 1 point awarded to RED team.",
-                type="warning",
-                position="top",
-                timeout=3000,
+            ui.button("Next Round", on_click=self._next_round).classes(_CTRL_BTN_CLS_NEXT_ROUND).style(
+                _CTRL_BTN_STYLE_WIDE
             )
-        except Exception as e:
-            logger.error(f"Error applying blue Gam-Jeom: {str(e)}")
-            ui.notify(f"Error applying blue Gam-Jeom: {str(e)}", type="negative")
 
-    def _add_red_gam_jeom(self):
-        """Add Gam-Jeom penalty to red team."""
-        try:
-            match_id = match_service.get_current_match_id()
-            if match_id is None:
-                return
-
-            action = GamJeomAction(penalized_team=TeamColor.RED, match_id=match_id, notes="Red team Gam-Jeom penalty")
-            match_service.add_gam_jeom(action)
-            self._update_display()
-
-            # Show confirmation dialog
-            ui.notify(
-                "Gam-Jeom penalty applied to RED team. 1 point awarded to BLUE team.",
-                type="warning",
-                position="top",
-                timeout=3000,
-            )
-        except Exception as e:
-            logger.error(f"Error applying red Gam-Jeom: {str(e)}")
-            ui.notify(f"Error applying red Gam-Jeom: {str(e)}", type="negative")
-
-    def _start_match(self):
+    @_safe_handler("Error adding {0.value} score")
+    async def _add_score(self, match_id: int, team: TeamColor, points: int):
+        """Add points to a team's score."""
+        action = ScoreAction(team_color=team, points=points, match_id=match_id)
+        score_field = f"{team.value.lower()}_score"
+        shown = await self._displayed_state()
+        await self._persist(
+            match_service.queue_score(action), shown, **{score_field: getattr(shown, score_field) + points}
+        )
+
+    @_safe_handler("Error applying {0.value} Gam-Jeom")
+    async def _add_gam_jeom(self, match_id: int, team: TeamColor):
+        """Add Gam-Jeom penalty to a team."""
+        opponent = OPPONENT[team]
+        action = GamJeomAction(
+            penalized_team=team, match_id=match_id, notes=f"{team.value.title()} team Gam-Jeom penalty"
+        )
+        gam_jeom_field = f"{team.value.lower()}_gam_jeom"
+        opponent_score_field = f"{opponent.value.lower()}_score"
+        shown = await self._displayed_state()
+        await self._persist(
+            match_service.queue_gam_jeom(action),
+            shown,
+            **{
+                gam_jeom_field: getattr(shown, gam_jeom_field) + 1,
+                opponent_score_field: getattr(shown, opponent_score_field) + 1,
+            },
+        )
+
+        # Show confirmation dialog
+        ui.notify(
+            f"Gam-Jeom penalty applied to {team.value} team. 1 point awarded to {opponent.value} team.",
+            type="warning",
+            position="top",
+            timeout=3000,
+        )
+
+    @_safe_handler("Error starting match")
+    async def _start_match(self, match_id: int):
         """Start the match."""
-        try:
-            match_id = match_service.get_current_match_id()
-            if match_id is None:
-                return
+        change = MatchStateChange(match_id=match_id, new_state=MatchState.RUNNING, notes="Match started")
+        shown = await self._displayed_state()
+        await self._persist(match_service.queue_state_change(change), shown, match_state=MatchState.RUNNING)
 
-            change = MatchStateChange(match_id=match_id, new_state=MatchState.RUNNING, notes="Match started")
-            match_service.change_match_state(change)
-            self._update_display()
+        ui.notify("Pertandingan dimulai!", type="positive", position="top", timeout=2000)
 
-            ui.notify("Pertandingan dimulai!", type="positive", position="top", timeout=2000)
-        except Exception as e:
-            logger.error(f"Error starting match: {str(e)}")
-            ui.notify(f"Error starting match: {str(e)}", type="negative")
-
-    def _pause_match(self):
+    @_safe_handler("Error pausing match")
+    async def _pause_match(self, match_id: int):
         """Pause the match."""
-        try:
-            match_id = match_service.get_current_match_id()
-            if match_id is None:
-                return
+        change = MatchStateChange(match_id=match_id, new_state=MatchState.PAUSED, notes="Match paused")
+        shown = await self._displayed_state()
+        await self._persist(match_service.queue_state_change(change), shown, match_state=MatchState.PAUSED)
 
-            change = MatchStateChange(match_id=match_id, new_state=MatchState.PAUSED, notes="Match paused")
-            match_service.change_match_state(change)
-            self._update_display()
+        ui.notify("Pertandingan dijeda!", type="info", position="top", timeout=2000)
 
-            ui.notify("Pertandingan dijeda!", type="info", position="top", timeout=2000)
-        except Exception as e:
-            logger.error(f"Error pausing match: {str(e)}")
-            ui.notify(f"Error pausing match: {str(e)}", type="negative")
-
-    def _reset_match(self):
+    @_safe_handler("Error resetting match")
+    async def _reset_match(self, match_id: int):
         """Reset the match."""
-        try:
-            match_id = match_service.get_current_match_id()
-            if match_id is None:
-                return
-
-            reset_action = MatchReset(match_id=match_id, notes="Manual match reset")
-            match_service.reset_match(reset_action)
-            self._update_display()
-
-            ui.notify(
-                "Match has been reset! All scores and round returned to initial values.",
-                type="info",
-                position="top",
-                timeout=3000,
-            )
-        except Exception as e:
-            logger.error(f"Error resetting match: {str(e)}")
-            ui.notify(f"Error resetting match: {str(e)}", type="negative")
-
-    def _next_round(self):
+        reset_action = MatchReset(match_id=match_id, notes="Manual match reset")
+        await self._persist(match_service.queue_reset(reset_action), CurrentMatchState())
+
+        ui.notify(
+            "Match has been reset! All scores and round returned to initial values.",
+            type="info",
+            position="top",
+            timeout=3000,
+        )
+
+    @_safe_handler("Error advancing round")
+    async def _next_round(self, match_id: int):
         """Advance to next round."""
-        try:
-            match_id = match_service.get_current_match_id()
-            if match_id is None:
-                return
+        shown = await self._displayed_state()
+        new_round_number = shown.current_round + 1
 
-            current_state = match_service.get_current_state()
-            new_round_number = current_state.current_round + 1
+        change = RoundChange(match_id=match_id, new_round=new_round_number)
+        await self._persist(match_service.queue_round_change(change), shown, current_round=new_round_number)
 
-            change = RoundChange(match_id=match_id, new_round=new_round_number)
-            match_service.next_round(change)
-            self._update_display()
+        ui.notify(f"Round {new_round_number} started!", type="positive", position="top", timeout=2000)
 
-            ui.notify(f"Round {new_round_number} started!", type="positive", position="top", timeout=2000)
-        except Exception as e:
-            logger.error(f"Error advancing round: {str(e)}")
-            ui.notify(f"Error advancing round: {str(e)}", type="negative")
+    async def _displayed_state(self) -> CurrentMatchState:
+        """State currently on screen, including writes that are still in flight."""
+        if self._optimistic_state is not None:
+            return self._optimistic_state
+        state = await self._committed_state()
+        # Another click may have started a write while the state was read
+        return self._optimistic_state if self._optimistic_state is not None else state
+
+    @staticmethod
+    async def _committed_state() -> CurrentMatchState:
+        """Read the current match state on the database executor, off the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(DB_EXECUTOR, match_service.get_current_state)
+
+    async def _persist(self, write: Awaitable[CurrentMatchState], shown: CurrentMatchState, **expected: Any) -> None:
+        """Render the shown state with the expected values right away, then await the queued write.
 
-    def _update_display(self):
-        """Update all display elements with current match state."""
+        The committed state replaces the optimistic one once no other write is in flight. If the write
+        fails, the display falls back to the last committed state and the error is re-raised.
+        """
+        self._optimistic_state = shown.model_copy(update=expected)
+        self._update_model(self._optimistic_state)
+
+        self._pending_writes += 1
+        try:
+            state = await write
+        except Exception:
+            self._optimistic_state = None
+            self._update_model(await self._committed_state())
+            raise
+        finally:
+            self._pending_writes -= 1
+
+        if self._pending_writes == 0:
+            self._optimistic_state = None
+            self._update_model(state)
+
+    def _update_model(self, state: CurrentMatchState):
+        """Show the given state.
+
+        Only the model is written here. NiceGUI's binding loop pushes changed texts to the labels on its
+        next pass, so a burst of clicks within one refresh interval costs a single label update.
+        """
         try:
-            current_state = match_service.get_current_state()
-
-            if self.blue_score_label:
-                self.blue_score_label.set_text(str(current_state.blue_score))
-            if self.red_score_label:
-                self.red_score_label.set_text(str(current_state.red_score))
-            if self.blue_gam_jeom_label:
-                self.blue_gam_jeom_label.set_text(str(current_state.blue_gam_jeom))
-            if self.red_gam_jeom_label:
-                self.red_gam_jeom_label.set_text(str(current_state.red_gam_jeom))
-            if self.round_label:
-                self.round_label.set_text(f"ROUND {current_state.current_round}")
+            self.model.update(self._display_texts(state))
 
         except Exception as e:
-            logger.error(f"Error updating display: {str(e)}")
+            logger.error("Error updating display: %s", e)
             ui.notify(f"Error updating display: {str(e)}", type="negative")
 
+    @staticmethod
+    def _display_texts(state: CurrentMatchState) -> dict[str, str]:
+        return {field: _FORMATTERS.get(field, str)(getattr(state, field)) for field in _DISPLAY_FIELDS}
+
 
 # Create global UI instance
 scoring_ui = ScoringUI()
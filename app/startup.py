@@ -1,8 +1,21 @@
 from app.database import create_tables
-from app.scoring_ui import scoring_ui
+from app.match_service import match_service
 
 
 def startup() -> None:
     # this function is called before the first request
     create_tables()
+    register_pages()
+
+
+def register_pages() -> None:
+    """Register the pages and shutdown hooks; the database schema must already exist."""
+    # The UI and NiceGUI are only imported once the database is set up
+    from nicegui import app
+
+    from app.scoring_ui import scoring_ui
+
     scoring_ui.create()
+    # Scores between checkpoints live in memory; write them back before the process exits, after the
+    # queued writes and on the thread that runs them
+    app.on_shutdown(match_service.shutdown)
@@ -1,12 +1,65 @@
+import os
+from pathlib import Path
 from typing import Generator
 import pytest
-from app.startup import startup
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
 from nicegui.testing import User
 
 pytest_plugins = ["nicegui.testing.plugin"]
 
 
+def _worker_database_url(url: str, worker: str) -> str:
+    """Give each pytest-xdist worker its own database, so parallel resets do not collide."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        if not parsed.database or parsed.database == ":memory:":
+            return url
+        path = Path(parsed.database)
+        return parsed.set(database=str(path.with_stem(f"{path.stem}_{worker}"))).render_as_string(hide_password=False)
+
+    database = f"{parsed.database}_{worker}"
+    admin_engine = create_engine(parsed, isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as conn:
+            exists = conn.execute(text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": database}).first()
+            if exists is None:
+                conn.execute(text(f'CREATE DATABASE "{database}"'))
+    finally:
+        admin_engine.dispose()
+    return parsed.set(database=database).render_as_string(hide_password=False)
+
+
+# The database URL is read when app.database is imported, so it is chosen before that. Tests run
+# against in-memory SQLite unless APP_TEST_DATABASE_URL names another database; APP_DATABASE_URL
+# is never used, as the tests wipe the tables.
+_TEST_DATABASE_URL = os.environ.get("APP_TEST_DATABASE_URL", "sqlite:///:memory:")
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+if _WORKER is not None:
+    _TEST_DATABASE_URL = _worker_database_url(_TEST_DATABASE_URL, _WORKER)
+os.environ["APP_DATABASE_URL"] = _TEST_DATABASE_URL
+
+from app.database import clear_tables, reset_db
+from app.match_service import match_service
+from app.startup import register_pages
+
+
+@pytest.fixture(scope="session")
+def _schema():
+    """Create the schema once per test session."""
+    reset_db()
+
+
+@pytest.fixture()
+def fresh_db(_schema):
+    """Provide empty tables and no current match for each test."""
+    clear_tables()
+    match_service.clear_current_match()
+
+
 @pytest.fixture
-def user(user: User) -> Generator[User, None, None]:
-    startup()
+def user(user: User, _schema) -> Generator[User, None, None]:
+    # NiceGUI resets its routes for every test, so only the pages are registered again; the schema
+    # is created once per session
+    register_pages()
     yield user
@@ -1,17 +1,29 @@
 """Tests for the match service layer."""
 
-import pytest
-from app.database import reset_db
-from app.match_service import MatchService, match_service
-from app.models import TeamColor, ScoreAction, GamJeomAction, MatchStateChange, RoundChange, MatchReset, MatchState
-
+import asyncio
+from datetime import datetime, timedelta, timezone
 
-@pytest.fixture()
-def fresh_db():
-    """Provide a fresh database for each test."""
-    reset_db()
-    yield
-    reset_db()
+import pytest
+from sqlalchemy import text
+from sqlmodel import asc, select
+from app.database import get_session
+from app.match_service import CHECKPOINT_EVERY_EVENTS, MatchService, match_service
+from app.models import (
+    TeamColor,
+    ScoreAction,
+    GamJeomAction,
+    MatchStateChange,
+    RoundChange,
+    MatchReset,
+    MatchState,
+    EventType,
+    Match,
+    MatchEvent,
+    CurrentMatchState,
+    MATCH_STATE_CODES,
+)
+
+pytestmark = pytest.mark.unit
 
 
 @pytest.fixture()
@@ -28,6 +40,27 @@ def test_create_new_match(fresh_db, service):
     assert service.get_current_match_id() == match_id
 
 
+def test_ensure_current_match(fresh_db, service):
+    """Test that a match is only created when there is no current one."""
+    match_id = service.ensure_current_match()
+    assert service.get_current_match_id() == match_id
+    assert service.ensure_current_match() == match_id
+
+
+def test_clear_current_match(fresh_db, service):
+    """Test that clearing the current match makes the next ensure create a new one."""
+    match_id = service.create_new_match()
+    service.add_score(ScoreAction(team_color=TeamColor.BLUE, points=3, match_id=match_id))
+
+    service.clear_current_match()
+    assert service.get_current_match_id() is None
+    assert service.get_current_state() == CurrentMatchState()
+
+    new_match_id = service.ensure_current_match()
+    assert new_match_id != match_id
+    assert service.get_current_state().blue_score == 0
+
+
 def test_get_initial_state(fresh_db, service):
     """Test getting initial match state."""
     service.create_new_match()
@@ -323,6 +356,51 @@ def test_edge_case_many_penalties(fresh_db, service):
     assert state.red_score == 5  # Red gets 5 points from blue penalties
 
 
+def test_apply_actions_matches_single_actions(fresh_db, service):
+    """Test that a list of actions ends in the same state, with the same events, as applying them one by one."""
+    match_id = service.create_new_match()
+    actions = [
+        MatchStateChange(match_id=match_id, new_state=MatchState.RUNNING),
+        ScoreAction(team_color=TeamColor.BLUE, points=3, match_id=match_id),
+        GamJeomAction(penalized_team=TeamColor.BLUE, match_id=match_id),
+        RoundChange(match_id=match_id, new_round=2),
+    ]
+
+    state = service.apply_actions(match_id, actions)
+    assert state == service.get_current_state()
+    assert (state.blue_score, state.red_score, state.blue_gam_jeom, state.current_round) == (3, 1, 1, 2)
+    assert state.match_state == MatchState.RUNNING
+    assert service.apply_actions(match_id, []) == state
+
+    with get_session() as session:
+        events = session.exec(
+            select(MatchEvent).where(MatchEvent.match_id == match_id).order_by(asc(MatchEvent.id))
+        ).all()
+    assert [event.event_type for event in events] == [
+        EventType.MATCH_CREATED,
+        EventType.STATE_CHANGE,
+        EventType.SCORE,
+        EventType.GAM_JEOM,
+        EventType.ROUND_CHANGE,
+    ]
+
+
+def test_apply_actions_rejects_other_matches(fresh_db, service):
+    """Test that actions addressed to another match are rejected before anything is written."""
+    match_id = service.create_new_match()
+    other_match_id = service.create_new_match()
+    actions = [
+        ScoreAction(team_color=TeamColor.BLUE, points=3, match_id=match_id),
+        ScoreAction(team_color=TeamColor.RED, points=1, match_id=other_match_id),
+    ]
+
+    with pytest.raises(ValueError, match=f"match {other_match_id}"):
+        service.apply_actions(match_id, actions)
+
+    service.set_current_match_id(match_id)
+    assert service.get_current_state().blue_score == 0
+
+
 def test_set_current_match_id(fresh_db, service):
     """Test manually setting current match ID."""
     match_id = service.create_new_match()
@@ -339,3 +417,369 @@ def test_set_current_match_id(fresh_db, service):
     state = other_service.get_current_state()
     assert state.blue_score == 0
     assert state.current_round == 1
+
+
+def test_events_recorded_with_each_mutation(fresh_db, service):
+    """Test that every mutation records its audit event in the same transaction."""
+    match_id = service.create_new_match()
+
+    service.add_score(ScoreAction(team_color=TeamColor.BLUE, points=3, match_id=match_id))
+    service.add_gam_jeom(GamJeomAction(penalized_team=TeamColor.BLUE, match_id=match_id))
+
+    with get_session() as session:
+        events = list(
+            session.exec(select(MatchEvent).where(MatchEvent.match_id == match_id).order_by(asc(MatchEvent.id)))
+        )
+
+    assert [event.event_type for event in events] == [EventType.MATCH_CREATED, EventType.SCORE, EventType.GAM_JEOM]
+    assert str(events[1].event_type) == "SCORE"
+    assert events[1].blue_score_before == 0
+    assert events[1].blue_score_after == 3
+    assert events[2].red_score_after == 1
+    assert events[2].blue_gam_jeom_after == 1
+
+
+def test_match_row_checkpointed_from_live_state(fresh_db, service):
+    """Test that scores stay in memory until a checkpoint and are rebuilt from events after a restart."""
+    match_id = service.create_new_match()
+    service.add_score(ScoreAction(team_color=TeamColor.BLUE, points=3, match_id=match_id))
+    service.add_gam_jeom(GamJeomAction(penalized_team=TeamColor.BLUE, match_id=match_id))
+
+    with get_session() as session:
+        match = session.get(Match, match_id)
+        assert match is not None
+        assert match.blue_score == 0
+
+    # A new service replays the events recorded after the last checkpoint
+    restarted = MatchService()
+    restarted.set_current_match_id(match_id)
+    state = restarted.get_current_state()
+    assert state.blue_score == 3
+    assert state.red_score == 1
+    assert state.blue_gam_jeom == 1
+
+    restarted.change_match_state(MatchStateChange(match_id=match_id, new_state=MatchState.RUNNING))
+    with get_session() as session:
+        match = session.get(Match, match_id)
+        assert match is not None
+        assert match.blue_score == 3
+        assert match.red_score == 1
+        assert match.match_state == MatchState.RUNNING
+
+
+def test_replay_ignores_event_timestamps(fresh_db, service):
+    """Test that events after the checkpoint are replayed even when their clock reading is not later."""
+    match_id = service.create_new_match()
+    service.add_score(ScoreAction(team_color=TeamColor.BLUE, points=2, match_id=match_id))
+    service.checkpoint()
+    service.add_score(ScoreAction(team_color=TeamColor.BLUE, points=3, match_id=match_id))
+
+    with get_session() as session:
+        match = session.get(Match, match_id)
+        assert match is not None
+        events = session.exec(
+            select(MatchEvent).where(MatchEvent.match_id == match_id).order_by(asc(MatchEvent.id))
+        ).all()
+        assert match.last_event_id == events[-2].id
+        # The clock stepped back between the checkpoint and the last event
+        latest = events[-1]
+        latest.created_at = match.updated_at - timedelta(seconds=1)
+        session.add(latest)
+        session.commit()
+
+    restarted = MatchService()
+    restarted.set_current_match_id(match_id)
+    assert restarted.get_current_state().blue_score == 5
+
+
+def test_checkpoint_every_n_events(fresh_db, service):
+    """Test that the matches row is written back after CHECKPOINT_EVERY_EVENTS actions and on demand."""
+    match_id = service.create_new_match()
+    for _ in range(CHECKPOINT_EVERY_EVENTS):
+        service.add_score(ScoreAction(team_color=TeamColor.RED, points=1, match_id=match_id))
+    service.add_score(ScoreAction(team_color=TeamColor.RED, points=2, match_id=match_id))
+
+    with get_session() as session:
+        match = session.get(Match, match_id)
+        assert match is not None
+        assert match.red_score == CHECKPOINT_EVERY_EVENTS
+
+    service.checkpoint()
+    with get_session() as session:
+        match = session.get(Match, match_id)
+        assert match is not None
+        assert match.red_score == CHECKPOINT_EVERY_EVENTS + 2
+
+
+def test_cached_state_follows_current_match(fresh_db, service):
+    """Test that the cached state is refreshed on mutation and dropped when switching matches."""
+    first_match_id = service.create_new_match()
+    service.add_score(ScoreAction(team_color=TeamColor.RED, points=3, match_id=first_match_id))
+    assert service.get_current_state().red_score == 3
+
+    second_match_id = service.create_new_match()
+    assert service.get_current_state().red_score == 0
+
+    service.set_current_match_id(first_match_id)
+    assert service.get_current_state().red_score == 3
+
+    service.set_current_match_id(second_match_id)
+    assert service.get_current_state().red_score == 0
+
+
+def test_reused_session_across_actions(fresh_db):
+    """Test a service that keeps one session alive across consecutive actions."""
+    service = MatchService(reuse_session=True)
+    match_id = service.create_new_match()
+
+    service.add_score(ScoreAction(team_color=TeamColor.BLUE, points=3, match_id=match_id))
+    service.add_gam_jeom(GamJeomAction(penalized_team=TeamColor.RED, match_id=match_id))
+    state = service.next_round(RoundChange(match_id=match_id, new_round=2))
+
+    assert state.blue_score == 4
+    assert state.red_gam_jeom == 1
+    assert state.current_round == 2
+
+    # A fresh service reading from the database sees the committed values
+    other_service = MatchService()
+    other_service.set_current_match_id(match_id)
+    assert other_service.get_current_state() == state
+
+
+def test_batch_events_writes_once_at_end(fresh_db, service):
+    """Test that events recorded in a batch are only written when the batch ends."""
+    match_id = service.create_new_match()
+
+    with service.batch_events():
+        for _ in range(3):
+            service.add_score(ScoreAction(team_color=TeamColor.BLUE, points=1, match_id=match_id))
+        with get_session() as session:
+            assert len(list(session.exec(select(MatchEvent).where(MatchEvent.event_type == EventType.SCORE)))) == 0
+
+    with get_session() as session:
+        scores = list(session.exec(select(MatchEvent).where(MatchEvent.event_type == EventType.SCORE)))
+    assert [event.blue_score_after for event in scores] == [1, 2, 3]
+    assert service.get_current_state().blue_score == 3
+
+
+def test_batch_events_written_when_block_raises(fresh_db, service):
+    """Test that actions applied before an error in a batch keep their events and survive a reload."""
+    match_id = service.create_new_match()
+
+    with pytest.raises(RuntimeError):
+        with service.batch_events():
+            service.add_score(ScoreAction(team_color=TeamColor.BLUE, points=3, match_id=match_id))
+            raise RuntimeError("interrupted")
+
+    assert service.get_current_state().blue_score == 3
+    with get_session() as session:
+        scores = list(session.exec(select(MatchEvent).where(MatchEvent.event_type == EventType.SCORE)))
+    assert [event.blue_score_after for event in scores] == [3]
+
+    restarted = MatchService()
+    restarted.set_current_match_id(match_id)
+    assert restarted.get_current_state().blue_score == 3
+
+
+def test_add_events_bulk(fresh_db, service):
+    """Test bulk insertion of imported events."""
+    match_id = service.create_new_match()
+    imported = [
+        {
+            "match_id": match_id,
+            "event_type": EventType.SCORE,
+            "team_color": TeamColor.RED,
+            "points_awarded": points,
+            "round_number": 1,
+            "round_before": 1,
+            "match_state_before": MatchState.RUNNING,
+            "match_state_after": MatchState.RUNNING,
+            "blue_score_before": 0,
+            "red_score_before": 0,
+            "blue_gam_jeom_before": 0,
+            "red_gam_jeom_before": 0,
+            "blue_score_after": 0,
+            "red_score_after": points,
+            "blue_gam_jeom_after": 0,
+            "red_gam_jeom_after": 0,
+            "notes": None,
+        }
+        for points in (1, 3)
+    ]
+
+    service.add_events_bulk(imported)
+    service.add_events_bulk([])
+
+    with get_session() as session:
+        events = list(session.exec(select(MatchEvent).where(MatchEvent.match_id == match_id)))
+    assert len(events) == 3  # creation event + 2 imported
+
+
+def test_add_events_bulk_survives_restart(fresh_db, service):
+    """Test that imported events set the same scores in this process and after a restart."""
+    match_id = service.create_new_match()
+    service.add_score(ScoreAction(team_color=TeamColor.BLUE, points=3, match_id=match_id))
+    imported = {
+        "match_id": match_id,
+        "event_type": EventType.SCORE,
+        "team_color": TeamColor.RED,
+        "points_awarded": 1,
+        "round_number": 1,
+        "round_before": 1,
+        "match_state_before": MatchState.NOT_STARTED,
+        "match_state_after": MatchState.NOT_STARTED,
+        "blue_score_before": 3,
+        "red_score_before": 0,
+        "blue_gam_jeom_before": 0,
+        "red_gam_jeom_before": 0,
+        "blue_score_after": 3,
+        "red_score_after": 1,
+        "blue_gam_jeom_after": 0,
+        "red_gam_jeom_after": 0,
+        "notes": None,
+    }
+
+    service.add_events_bulk([imported])
+    state = service.get_current_state()
+    assert (state.blue_score, state.red_score) == (3, 1)
+
+    # The live blue score was checkpointed before the import
+    with get_session() as session:
+        match = session.get(Match, match_id)
+        assert match is not None
+        assert match.blue_score == 3
+
+    restarted = MatchService()
+    restarted.set_current_match_id(match_id)
+    assert restarted.get_current_state() == state
+
+
+def test_event_descriptions_from_structured_columns(fresh_db, service):
+    """Test that event descriptions are derived on read and only user notes are stored."""
+    match_id = service.create_new_match()
+    service.add_score(ScoreAction(team_color=TeamColor.BLUE, points=3, match_id=match_id))
+    service.add_gam_jeom(GamJeomAction(penalized_team=TeamColor.RED, match_id=match_id, notes="Leaving the ring"))
+    service.change_match_state(MatchStateChange(match_id=match_id, new_state=MatchState.RUNNING))
+    service.next_round(RoundChange(match_id=match_id, new_round=2))
+    service.reset_match(MatchReset(match_id=match_id))
+
+    with get_session() as session:
+        events = list(
+            session.exec(select(MatchEvent).where(MatchEvent.match_id == match_id).order_by(asc(MatchEvent.id)))
+        )
+
+    assert [event.notes for event in events] == [None, None, "Leaving the ring", None, None, None]
+    assert [event.describe() for event in events] == [
+        "New match created",
+        "BLUE team scored 3 points",
+        "Gam-Jeom penalty for RED, point awarded to BLUE (Leaving the ring)",
+        "Match state changed from NOT_STARTED to RUNNING",
+        "Round changed from 1 to 2",
+        "Match reset: Scores 4-0, Gam-Jeom 0-1, Round 2 → All reset to 0-0, 0-0, Round 1",
+    ]
+
+
+async def test_queued_actions_are_flushed_together(fresh_db, service):
+    """Test that actions submitted in the same window are applied in order in one transaction."""
+    match_id = service.create_new_match()
+
+    states = await asyncio.gather(
+        service.queue_score(ScoreAction(team_color=TeamColor.BLUE, points=1, match_id=match_id)),
+        service.queue_score(ScoreAction(team_color=TeamColor.BLUE, points=3, match_id=match_id)),
+        service.queue_gam_jeom(GamJeomAction(penalized_team=TeamColor.BLUE, match_id=match_id)),
+    )
+
+    assert [state.blue_score for state in states] == [1, 4, 4]
+    assert [state.red_score for state in states] == [0, 0, 1]
+    assert service.get_current_state() == states[-1]
+
+    with get_session() as session:
+        events = list(session.exec(select(MatchEvent).where(MatchEvent.event_type != EventType.MATCH_CREATED)))
+    assert len(events) == 3
+    assert len({event.created_at for event in events}) == 1  # single flush transaction
+
+
+async def test_shutdown_checkpoints_after_queued_writes(fresh_db, service):
+    """Test that shutdown applies the still-queued actions before writing the matches row."""
+    match_id = service.create_new_match()
+    pending = [
+        asyncio.create_task(
+            service.queue_score(ScoreAction(team_color=TeamColor.RED, points=points, match_id=match_id))
+        )
+        for points in (1, 3)
+    ]
+    await asyncio.sleep(0)  # let the tasks submit their actions
+
+    await service.shutdown()
+    assert all(task.done() for task in pending)
+    with get_session() as session:
+        match = session.get(Match, match_id)
+        assert match is not None
+        assert match.red_score == 4
+
+
+async def test_queued_control_actions_keep_submission_order(fresh_db, service):
+    """Test that queued resets and round changes apply after the scores submitted before them."""
+    match_id = service.create_new_match()
+
+    states = await asyncio.gather(
+        service.queue_score(ScoreAction(team_color=TeamColor.RED, points=3, match_id=match_id)),
+        service.queue_round_change(RoundChange(match_id=match_id, new_round=2)),
+        service.queue_reset(MatchReset(match_id=match_id)),
+        service.queue_score(ScoreAction(team_color=TeamColor.RED, points=1, match_id=match_id)),
+        service.queue_state_change(MatchStateChange(match_id=match_id, new_state=MatchState.RUNNING)),
+    )
+
+    assert [state.red_score for state in states] == [3, 3, 0, 1, 1]
+    assert [state.current_round for state in states] == [1, 2, 1, 1, 1]
+    assert states[-1].match_state == MatchState.RUNNING
+
+
+def test_timestamps_are_naive_utc(fresh_db, service):
+    """Test that model defaults and service writes share the naive UTC convention of the columns."""
+    before = datetime.now(timezone.utc).replace(tzinfo=None)
+    assert Match().created_at.tzinfo is None
+    assert Match().created_at >= before
+
+    match_id = service.create_new_match()
+    service.add_score(ScoreAction(team_color=TeamColor.BLUE, points=1, match_id=match_id))
+    with get_session() as session:
+        match = session.get(Match, match_id)
+        assert match is not None
+        events = session.exec(select(MatchEvent).where(MatchEvent.match_id == match_id)).all()
+    timestamps = [match.created_at, match.updated_at] + [event.created_at for event in events]
+    assert all(timestamp.tzinfo is None for timestamp in timestamps)
+    assert all(abs(timestamp - before) < timedelta(minutes=1) for timestamp in timestamps)
+
+
+def test_constructed_state_matches_validated_state(fresh_db, service):
+    """Test that the state built without validation equals a validated one."""
+    match_id = service.create_new_match()
+    state = service.add_score(ScoreAction(team_color=TeamColor.RED, points=3, match_id=match_id))
+
+    assert state == CurrentMatchState(red_score=3)
+    assert state.model_dump() == CurrentMatchState(red_score=3).model_dump()
+
+
+def test_match_state_stored_as_integer(fresh_db, service):
+    """Test that match states round-trip through their integer column."""
+    match_id = service.create_new_match()
+    service.change_match_state(MatchStateChange(match_id=match_id, new_state=MatchState.PAUSED))
+
+    with get_session() as session:
+        stored = session.execute(text("SELECT match_state FROM matches WHERE id = :id"), {"id": match_id}).scalar()
+        assert stored == MATCH_STATE_CODES[MatchState.PAUSED]
+        match = session.get(Match, match_id)
+        assert match is not None
+        assert match.match_state is MatchState.PAUSED
+
+
+def test_match_state_serialized_by_name():
+    """Test that the API and its schema keep match states as strings."""
+    state = CurrentMatchState(match_state=MatchState.RUNNING)
+
+    assert '"match_state":"RUNNING"' in state.model_dump_json()
+    assert CurrentMatchState.model_validate_json(state.model_dump_json()) == state
+    schema = CurrentMatchState.model_json_schema()["$defs"]["MatchState"]
+    assert schema["type"] == "string"
+    assert schema["enum"] == ["NOT_STARTED", "RUNNING", "PAUSED", "FINISHED"]
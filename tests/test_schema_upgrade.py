@@ -0,0 +1,167 @@
+"""Tests for upgrading databases created by the first release of the app."""
+
+from typing import Iterator
+
+import pytest
+from sqlalchemy import Connection, inspect, text
+from sqlmodel import Session, col, func, select
+
+from app.database import ENGINE, IS_SQLITE
+from app.models import MATCH_STATE_CODES, Match, MatchEvent, MatchState
+from app.schema_upgrade import upgrade_schema
+
+pytestmark = [pytest.mark.unit, pytest.mark.skipif(IS_SQLITE, reason="only PostgreSQL databases are upgraded")]
+
+# Tables as the first release created them
+OLD_SCHEMA = (
+    "CREATE TYPE matchstate AS ENUM ('NOT_STARTED', 'RUNNING', 'PAUSED', 'FINISHED')",
+    "CREATE TYPE teamcolor AS ENUM ('BLUE', 'RED')",
+    """CREATE TABLE matches (
+        id SERIAL PRIMARY KEY,
+        blue_score INTEGER NOT NULL,
+        red_score INTEGER NOT NULL,
+        blue_gam_jeom INTEGER NOT NULL,
+        red_gam_jeom INTEGER NOT NULL,
+        current_round INTEGER NOT NULL,
+        match_state matchstate NOT NULL,
+        created_at TIMESTAMP NOT NULL,
+        updated_at TIMESTAMP NOT NULL
+    )""",
+    """CREATE TABLE match_events (
+        id SERIAL PRIMARY KEY,
+        match_id INTEGER NOT NULL REFERENCES matches (id),
+        event_type VARCHAR(50) NOT NULL,
+        team_color teamcolor,
+        points_awarded INTEGER NOT NULL,
+        round_number INTEGER NOT NULL,
+        blue_score_before INTEGER NOT NULL,
+        red_score_before INTEGER NOT NULL,
+        blue_gam_jeom_before INTEGER NOT NULL,
+        red_gam_jeom_before INTEGER NOT NULL,
+        blue_score_after INTEGER NOT NULL,
+        red_score_after INTEGER NOT NULL,
+        blue_gam_jeom_after INTEGER NOT NULL,
+        red_gam_jeom_after INTEGER NOT NULL,
+        notes VARCHAR(500),
+        created_at TIMESTAMP NOT NULL
+    )""",
+)
+
+# One match as the first release recorded it: (event_type, team, points, round, blue/red score and
+# Gam-Jeom after, notes); every event's "before" counters are the previous event's "after" counters
+OLD_EVENTS = (
+    ("MATCH_CREATED", None, 0, 1, (0, 0, 0, 0), "New match created"),
+    ("STATE_CHANGE", None, 0, 1, (0, 0, 0, 0), "Match state changed from NOT_STARTED to RUNNING"),
+    ("SCORE", "BLUE", 3, 1, (3, 0, 0, 0), "BLUE team scored 3 points"),
+    ("ROUND_CHANGE", None, 0, 2, (3, 0, 0, 0), "Round changed from 1 to 2"),
+    ("GAM_JEOM", "BLUE", 1, 2, (3, 1, 1, 0), "Gam-Jeom penalty for BLUE, point awarded to RED"),
+    (
+        "RESET",
+        None,
+        0,
+        1,
+        (0, 0, 0, 0),
+        "Match reset: Scores 3-1, Gam-Jeom 1-0, Round 2 → All reset to 0-0, 0-0, Round 1",
+    ),
+    ("SCORE", "RED", 1, 1, (0, 1, 0, 0), "RED team scored 1 points"),
+)
+
+
+@pytest.fixture()
+def old_database() -> Iterator[Connection]:
+    """A connection to tables of the first release holding one match; everything is rolled back afterwards."""
+    with ENGINE.connect() as conn:
+        conn.execute(text("CREATE SCHEMA upgrade_test"))
+        conn.execute(text("SET LOCAL search_path TO upgrade_test"))
+        for statement in OLD_SCHEMA:
+            conn.execute(text(statement))
+
+        conn.execute(
+            text("INSERT INTO matches VALUES (1, 0, 1, 0, 0, 1, 'NOT_STARTED', '2025-01-01 10:00', '2025-01-01 10:05')")
+        )
+        before = (0, 0, 0, 0)
+        for event_type, team, points, round_number, after, notes in OLD_EVENTS:
+            conn.execute(
+                text(
+                    "INSERT INTO match_events (match_id, event_type, team_color, points_awarded, round_number, "
+                    "blue_score_before, red_score_before, blue_gam_jeom_before, red_gam_jeom_before, "
+                    "blue_score_after, red_score_after, blue_gam_jeom_after, red_gam_jeom_after, notes, created_at) "
+                    "VALUES (1, :event_type, :team, :points, :round_number, :b0, :b1, :b2, :b3, :a0, :a1, :a2, :a3, "
+                    ":notes, '2025-01-01 10:00')"
+                ),
+                {
+                    "event_type": event_type,
+                    "team": team,
+                    "points": points,
+                    "round_number": round_number,
+                    **{f"b{i}": value for i, value in enumerate(before)},
+                    **{f"a{i}": value for i, value in enumerate(after)},
+                    "notes": notes,
+                },
+            )
+            before = after
+
+        yield conn
+        conn.rollback()
+
+
+def test_event_types_converted_to_codes(old_database):
+    """Test that event type names become their SMALLINT codes."""
+    upgrade_schema(old_database)
+    upgrade_schema(old_database)  # a second run finds nothing left to do
+
+    event_types = old_database.execute(text("SELECT event_type FROM match_events ORDER BY id")).scalars().all()
+    assert event_types == [1, 4, 2, 5, 3, 6, 2]
+
+
+def test_match_state_converted_to_codes(old_database):
+    """Test that the match state enum becomes its SMALLINT code and the enum type is dropped."""
+    upgrade_schema(old_database)
+
+    assert (
+        old_database.execute(text("SELECT match_state FROM matches")).scalar()
+        == MATCH_STATE_CODES[MatchState.NOT_STARTED]
+    )
+    assert old_database.execute(text("SELECT to_regtype('matchstate')")).scalar() is None
+
+
+def test_event_transitions_recovered_from_notes(old_database):
+    """Test that the round and match states of old events are read back from their generated notes."""
+    upgrade_schema(old_database)
+    upgrade_schema(old_database)
+
+    with Session(bind=old_database) as session:
+        events = session.exec(select(MatchEvent).order_by(col(MatchEvent.id))).all()
+
+    assert [event.round_before for event in events] == [1, 1, 1, 1, 2, 2, 1]
+    not_started, running = MatchState.NOT_STARTED, MatchState.RUNNING
+    assert [event.match_state_before for event in events] == [not_started] * 2 + [running] * 4 + [not_started]
+    assert [event.match_state_after for event in events] == [not_started] + [running] * 4 + [not_started] * 2
+    # The generated notes are gone and describe() rebuilds the same text from the columns
+    assert all(event.notes is None for event in events)
+    assert [event.describe() for event in events] == [notes for *_, notes in OLD_EVENTS]
+
+
+def test_event_indexes_created(old_database):
+    """Test that the event indexes of the current model are added to the old table."""
+    upgrade_schema(old_database)
+    upgrade_schema(old_database)
+
+    indexes = inspect(old_database).get_indexes("match_events")
+    assert [(index["name"], index["column_names"]) for index in indexes] == [
+        ("ix_match_events_match_id_id", ["match_id", "id"])
+    ]
+
+
+def test_matches_checkpointed_at_last_event(old_database):
+    """Test that old matches count as checkpointed at their last event, so no event is replayed twice."""
+    upgrade_schema(old_database)
+    upgrade_schema(old_database)
+
+    with Session(bind=old_database) as session:
+        match = session.get(Match, 1)
+        last_event_id = session.exec(select(func.max(MatchEvent.id))).one()
+
+    assert match is not None
+    assert match.last_event_id == last_event_id
+    assert (match.blue_score, match.red_score, match.match_state) == (0, 1, MatchState.NOT_STARTED)
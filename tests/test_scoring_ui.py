@@ -1,89 +1,95 @@
 """Tests for the scoring UI functionality."""
 
+import asyncio
+
 import pytest
+from nicegui.elements.mixins.text_element import TextElement
 from nicegui.testing import User
-from app.database import reset_db
 from app.match_service import match_service
+from app.models import (
+    TeamColor,
+    ScoreAction,
+    GamJeomAction,
+    MatchStateChange,
+    RoundChange,
+    MatchReset,
+    MatchState,
+)
 
 
-@pytest.fixture()
-def fresh_db():
-    """Provide a fresh database for each test."""
-    reset_db()
-    # Clear any existing match state
-    match_service._current_match_id = None
-    yield
-    reset_db()
+# Texts shown on a freshly loaded scoring page: the display elements, then the control buttons
+EXPECTED_TEXTS = frozenset({"BLUE", "RED", "MATCH", "ROUND 1", "GAM-JEOM", "Start", "Pause", "Reset", "Next Round"})
+# Scoring buttons, one of each for each team
+EXPECTED_BUTTON_COUNTS = {"+1": 2, "+3": 2, "Gam-Jeom": 2}
+
+
+def rendered_texts(user: User) -> set[str]:
+    """Collect the texts of all elements on the current page in one pass."""
+    return {element.text for element in user.current_layout.descendants() if isinstance(element, TextElement)}
+
+
+async def wait_for_text(user: User, marker: str, text: str, retries: int = 20) -> None:
+    """Wait until the element with the marker shows exactly the text; bound labels update on NiceGUI's binding loop."""
+    (element,) = user.find(marker=marker, kind=TextElement).elements
+    for _ in range(retries):
+        if element.text == text:
+            return
+        await asyncio.sleep(0.1)
+    assert element.text == text
 
 
+@pytest.mark.ui
 async def test_scoring_page_loads(user: User, fresh_db) -> None:
-    """Test that the scoring page loads with initial values."""
+    """Test that the scoring page loads with initial values and all of its controls."""
     await user.open("/")
 
-    # Check that main elements are visible
-    await user.should_see("BLUE")
-    await user.should_see("RED")
-    await user.should_see("MATCH")
-    await user.should_see("ROUND 1")
-    await user.should_see("GAM-JEOM")
+    assert EXPECTED_TEXTS <= rendered_texts(user)
+    for text, count in EXPECTED_BUTTON_COUNTS.items():
+        assert len(user.find(text).elements) == count, text
 
 
-async def test_ui_smoke_basic_functionality(user: User, fresh_db) -> None:
-    """Basic smoke test to ensure UI loads and functions."""
+@pytest.mark.ui
+async def test_next_round_updates_display(user: User, fresh_db) -> None:
+    """Test that a control button refreshes the display from the state returned by the service."""
     await user.open("/")
-
-    # Verify all key elements are present
-    await user.should_see("BLUE")
-    await user.should_see("RED")
-    await user.should_see("MATCH")
     await user.should_see("ROUND 1")
-    await user.should_see("GAM-JEOM")
 
-    # Verify buttons are present (basic smoke test)
-    assert len(list(user.find("+1").elements)) == 2
-    assert len(list(user.find("+3").elements)) == 2
-    assert len(list(user.find("Gam-Jeom").elements)) == 2
+    user.find("Next Round").click()
+    await user.should_see("ROUND 2")
 
 
-async def test_ui_elements_exist(user: User, fresh_db) -> None:
-    """Test that all required UI elements exist."""
+@pytest.mark.ui
+async def test_click_burst_renders_latest_state(user: User, fresh_db) -> None:
+    """Test that the bound labels settle on the state of the last queued click."""
     await user.open("/")
 
-    # Check scoring buttons exist
-    assert len(list(user.find("+1").elements)) == 2  # One for each team
-    assert len(list(user.find("+3").elements)) == 2  # One for each team
-    assert len(list(user.find("Gam-Jeom").elements)) == 2  # One for each team
-
-    # Check control buttons exist
-    await user.should_see("Start")
-    await user.should_see("Pause")
-    await user.should_see("Reset")
-    await user.should_see("Next Round")
+    for _ in range(3):
+        user.find("Next Round").click()
+    await user.should_see("ROUND 4")
 
-    # Check display elements exist
-    await user.should_see("BLUE")
-    await user.should_see("RED")
-    await user.should_see("MATCH")
-    await user.should_see("GAM-JEOM")
 
-
-async def test_page_layout_structure(user: User, fresh_db) -> None:
-    """Test that the page has proper layout structure."""
+@pytest.mark.ui
+async def test_score_buttons_update_display(user: User, fresh_db) -> None:
+    """Test that score clicks are rendered on the score label of the team that scored."""
     await user.open("/")
 
-    # The page should load without errors
-    # Basic smoke test to ensure no critical UI failures
-    await user.should_see("MATCH")
+    user.find(marker="blue_add_3").click()
+    user.find(marker="red_add_1").click()
+    await wait_for_text(user, "blue_score", "3")
+    await wait_for_text(user, "red_score", "1")
 
-    # Verify key structural elements are present
-    await user.should_see("ROUND 1")
+
+@pytest.fixture()
+def fresh_match_id(fresh_db) -> int:
+    """Provide a new current match on an empty database."""
+    return match_service.create_new_match()
 
 
 # Service-level tests (preferred approach for testing logic)
-def test_service_integration_scoring(fresh_db):
+@pytest.mark.unit
+def test_service_integration_scoring(fresh_match_id):
     """Test service integration for scoring logic (preferred test approach)."""
-    # Create new match
-    match_id = match_service.create_new_match()
+    match_id = fresh_match_id
     assert match_id is not None
 
     # Test initial state
@@ -93,21 +99,18 @@ def test_service_integration_scoring(fresh_db):
     assert state.current_round == 1
 
     # Test scoring via service
-    from app.models import ScoreAction, TeamColor
-
     action = ScoreAction(team_color=TeamColor.BLUE, points=1, match_id=match_id)
     new_state = match_service.add_score(action)
     assert new_state.blue_score == 1
     assert new_state.red_score == 0
 
 
-def test_service_integration_penalties(fresh_db):
+@pytest.mark.unit
+def test_service_integration_penalties(fresh_match_id):
     """Test service integration for penalty logic."""
-    match_id = match_service.create_new_match()
+    match_id = fresh_match_id
 
     # Apply Gam-Jeom to blue team
-    from app.models import GamJeomAction, TeamColor
-
     action = GamJeomAction(penalized_team=TeamColor.BLUE, match_id=match_id)
     state = match_service.add_gam_jeom(action)
 
@@ -118,12 +121,10 @@ def test_service_integration_penalties(fresh_db):
     assert state.red_score == 1
 
 
-def test_service_integration_match_controls(fresh_db):
+@pytest.mark.unit
+def test_service_integration_match_controls(fresh_match_id):
     """Test service integration for match control logic."""
-    match_id = match_service.create_new_match()
-
-    # Test state changes
-    from app.models import MatchStateChange, MatchState, RoundChange, MatchReset
+    match_id = fresh_match_id
 
     # Start match
     start_change = MatchStateChange(match_id=match_id, new_state=MatchState.RUNNING)
@@ -136,8 +137,6 @@ def test_service_integration_match_controls(fresh_db):
     assert state.current_round == 2
 
     # Add some scores first
-    from app.models import ScoreAction, TeamColor
-
     score_action = ScoreAction(team_color=TeamColor.BLUE, points=3, match_id=match_id)
     match_service.add_score(score_action)
 
@@ -150,27 +149,24 @@ def test_service_integration_match_controls(fresh_db):
     assert state.match_state == MatchState.NOT_STARTED
 
 
-def test_complex_match_scenario(fresh_db):
+@pytest.mark.unit
+def test_complex_match_scenario(fresh_match_id):
     """Test a complex match scenario with multiple actions."""
-    match_id = match_service.create_new_match()
-
-    from app.models import ScoreAction, GamJeomAction, TeamColor, MatchStateChange, MatchState
-
-    # Start match
-    start_change = MatchStateChange(match_id=match_id, new_state=MatchState.RUNNING)
-    match_service.change_match_state(start_change)
-
-    # Blue scores 3 points
-    action1 = ScoreAction(team_color=TeamColor.BLUE, points=3, match_id=match_id)
-    match_service.add_score(action1)
-
-    # Red scores 1 point
-    action2 = ScoreAction(team_color=TeamColor.RED, points=1, match_id=match_id)
-    match_service.add_score(action2)
-
-    # Red gets Gam-Jeom (blue gets +1 point)
-    penalty = GamJeomAction(penalized_team=TeamColor.RED, match_id=match_id)
-    state = match_service.add_gam_jeom(penalty)
+    match_id = fresh_match_id
+
+    state = match_service.apply_actions(
+        match_id,
+        [
+            # Start match
+            MatchStateChange(match_id=match_id, new_state=MatchState.RUNNING),
+            # Blue scores 3 points
+            ScoreAction(team_color=TeamColor.BLUE, points=3, match_id=match_id),
+            # Red scores 1 point
+            ScoreAction(team_color=TeamColor.RED, points=1, match_id=match_id),
+            # Red gets Gam-Jeom (blue gets +1 point)
+            GamJeomAction(penalized_team=TeamColor.RED, match_id=match_id),
+        ],
+    )
 
     # Final state should be: Blue=4 (3+1), Red=1, Blue Gam-Jeom=0, Red Gam-Jeom=1
     assert state.blue_score == 4
@@ -180,10 +176,11 @@ def test_complex_match_scenario(fresh_db):
     assert state.match_state == MatchState.RUNNING
 
 
+@pytest.mark.unit
 def test_ui_state_management_without_match(fresh_db):
     """Test UI behavior when no match is active."""
     # Clear any existing match
-    match_service._current_match_id = None
+    match_service.clear_current_match()
 
     # Getting state should return default values
     state = match_service.get_current_state()
@@ -9,6 +9,8 @@ logger = getLogger(__name__)
 
 pytest_plugins = ["nicegui.testing.user_plugin"]
 
+pytestmark = pytest.mark.ui
+
 
 def extract_navigation_paths(element) -> List[str]:
     paths = []